@@ -1,5 +1,15 @@
 import pandas as pd
-from data_import.utils import derive_rtu_address_and_protocol_from_po_rtu_name, convert_control_id_to_generic_control_id
+from data_import.utils import attach_rtu_address_and_protocol, convert_control_ids_to_generic_control_ids
+
+# controls auto test columns and their new names
+CONTROLS_TEST_COLUMN_RENAMES = {
+    'control_address': 'AutoTestAddress',
+    'control_status': 'AutoTestStatus',
+    'control_result': 'AutoTestResult',
+    'component_alias': 'AutoTestAlias',
+    'control_attribute': 'AutoTestAttribute',
+    'telecontrol_action': 'AutoTestAction'
+}
 
 def clean_controls_test(df: pd.DataFrame, eterra_rtu_map: pd.DataFrame) -> pd.DataFrame:
     """Clean the controls test dataframe."""
@@ -39,37 +49,23 @@ def clean_controls_test(df: pd.DataFrame, eterra_rtu_map: pd.DataFrame) -> pd.Da
     # | event3_zone             | 
     # | event3_substation       | 
 
-    df.rename(columns={
-        'control_address': 'AutoTestAddress',
-        'control_status': 'AutoTestStatus',
-        'control_result': 'AutoTestResult',
-        'component_alias': 'AutoTestAlias',
-        'control_attribute': 'AutoTestAttribute',
-        'telecontrol_action': 'AutoTestAction'
-    }, inplace=True)
+    df = df.rename(columns=CONTROLS_TEST_COLUMN_RENAMES)
 
-    def convert_po_rtu_eterra_rtu_name(row):
-        if row['RTU'] == '':
-            return None
-        else:
-            return row['RTU'].replace('_RTU', '')
-        
-    def convert_poweron_word_to_generic_word(row):
-        if row['Word'] == '':
-            return None
-        else:
-            return str(int(row['Word'])+1) # +1 because the word is 1-based in eterra
-        
-    # decompose the AutoTestAddress into Card, Word, and CtrlId
-    df['Card'] = df['AutoTestAddress'].str.split(':').str[0]
-    df['Word'] = df['AutoTestAddress'].str.split(':').str[1]
-    df['Word'] = df.apply(convert_poweron_word_to_generic_word, axis=1)
-    df['CtrlId'] = df['AutoTestAddress'].str.split(':').str[2]
+    # decompose the AutoTestAddress into Card, Word, and CtrlId with one split
+    address_parts = df['AutoTestAddress'].str.split(':', expand=True).reindex(columns=range(3))
+    df['Card'] = address_parts[0]
+    # +1 because the word is 1-based in eterra, a blank word stays None
+    word = address_parts[1]
+    has_word = word != ''
+    df['Word'] = None
+    df.loc[has_word, 'Word'] = (word[has_word].astype(int) + 1).astype(str)
+    df['CtrlId'] = address_parts[2]
     df['GenericType'] = "C"
     # get the rtu_address and protocol from the RTU and the eterra_rtu_map dataframe
-    df[['RTUAddress', 'Protocol']] = df.apply(lambda row: pd.Series(derive_rtu_address_and_protocol_from_po_rtu_name(row, eterra_rtu_map)), axis=1)
-    df['RTU'] = df.apply(convert_po_rtu_eterra_rtu_name, axis=1)
-    df['CtrlId'] = df.apply(lambda row: convert_control_id_to_generic_control_id(row['CtrlId'], row['GenericType']), axis=1)
+    df = attach_rtu_address_and_protocol(df, eterra_rtu_map)
+    # convert the PowerOn RTU name to the eTerra RTU name - a blank RTU has no name
+    df['RTU'] = df['RTU'].str.replace('_RTU', '', regex=False).where(df['RTU'] != '', None)
+    df['CtrlId'] = convert_control_ids_to_generic_control_ids(df['CtrlId'], df['GenericType'])
     df['GenericPointAddress'] = '[(' + df['RTU'].astype(str) + ':' + df['RTUAddress'].astype(str) + '):' + df['Card'].astype(str) + ':' + df['Word'].astype(str) + '-' + df['CtrlId'].astype(str) + ' C]'
 
     # Only return the columns we need
@@ -1,8 +1,12 @@
 
-from data_import.utils import combine_ioa, ignore_habbde_point, convert_control_id_to_generic_control_id, get_controllable_for_taps
+from data_import.utils import build_generic_point_address, combine_ioa, convert_control_ids_to_generic_control_ids, convert_to_int_or_none, ignore_habbde_point, join_columns, get_controllable_for_taps, keep_columns, strip_column
 from pylib3i.habdde import read_habdde_tab_into_df, read_habdde_point_tab_into_df
+import numpy as np
 import pandas as pd
 
+# Low cardinality columns that are stored as categoricals once the cleaners have finished with them
+HABDDE_CATEGORICAL_COLUMNS = ['Protocol', 'RTU', 'Sub', 'DeviceType', 'GenericType']
+
 def import_habdde_export_point_tab(file_path: str, debug_dir: str) -> pd.DataFrame:
     """Import the HABDDE export file."""
     
@@ -56,6 +60,40 @@ def import_habdde_export_setpoint_control_tab(file_path: str, debug_dir: str) ->
     return eterra_setpoint_control_export
 
 
+def add_eterra_alias_and_rtu_id(df: pd.DataFrame) -> pd.DataFrame:
+    """Add the eTerraAlias (Sub/DeviceType/DeviceId/PointId) and RTUId ((RTU:RTUAddress)) columns."""
+    df['eTerraAlias'] = join_columns([df['Sub'], df['DeviceType'], df['DeviceId'], df['PointId']], '/')
+    df['RTUId'] = join_columns([df['RTU'], df['RTUAddress'].astype(str)], ':', prefix='(', suffix=')')
+    return df
+
+
+def add_habdde_addresses(df: pd.DataFrame) -> pd.DataFrame:
+    """Add the CASDU, IOA, IOA1, IOA2 and GenericPointAddress columns derived from the RTUId, Card, Word, and GenericType."""
+    df[['CASDU', 'IOA', 'IOA1', 'IOA2', 'GenericPointAddress']] = derive_addresses_for_habdde_export(df)
+    return df
+
+
+def finalize_habdde_export(df: pd.DataFrame, columns_to_keep: list, only_existing: bool = False) -> pd.DataFrame:
+    """Strip the eTerraKey, keep only the columns we need and store the low cardinality columns as categoricals."""
+    # strip the eTerraKey of any leading or trailing whitespace - keys repeat, so strip each distinct key once
+    df['eTerraKey'] = strip_column(df['eTerraKey'])
+
+    if only_existing:
+        # Only keep columns that exist in df to avoid KeyError
+        columns_to_keep = [col for col in columns_to_keep if col in df.columns]
+        # Ensure we have at least some columns before filtering
+        if len(columns_to_keep) == 0:
+            print("Warning: No matching columns found in dataframe")
+            return convert_habdde_columns_to_categorical(df)
+
+    return convert_habdde_columns_to_categorical(keep_columns(df, columns_to_keep))
+
+
+def convert_habdde_columns_to_categorical(df: pd.DataFrame) -> pd.DataFrame:
+    """Store the low cardinality habdde columns as categoricals - done after the string columns have been built from them."""
+    return df.astype({col: 'category' for col in HABDDE_CATEGORICAL_COLUMNS if col in df.columns})
+
+
 def derive_rtu_addresses_and_protocols_from_eterra_export(eterra_point_export: pd.DataFrame, debug_dir: str) -> pd.DataFrame:
     """Derive the RTU addresses and protocols from the eTerra export."""
     eterra_rtu_map = eterra_point_export[['RTU', 'RTUAddress', 'Protocol']].drop_duplicates()
@@ -64,50 +102,117 @@ def derive_rtu_addresses_and_protocols_from_eterra_export(eterra_point_export: p
     return eterra_rtu_map
 
 
-def derive_addresses_for_habdde_export(row):
-
-    if row['GenericType'] not in ['CTRL', 'SETPOINT']:
-        CtrlText = ""
-        TypeText = row['GenericType']
-    else:
-        TypeText = "C"
-        if row['CtrlFunc'] == '' or row['CtrlFunc'] is None:
-            CtrlText = ""
-        else:
-            CtrlText =  convert_control_id_to_generic_control_id(row['CtrlFunc'], row['GenericType'])
-
-    if row['Protocol'] == 'MK2A':
-        return pd.Series({
-            'CASDU': None,
-            'IOA': None, 
-            'IOA1': None,
-            'IOA2': None,
-            'GenericPointAddress': f"[{row['RTUId']}:{row['Card']}:{row['Word']}-{CtrlText} {TypeText}]"
-        })
-    else:
-
-        try:
-            ioa1 = int(row['Card'])
-            ioa2 = int(row['Word'])
-            ioa = combine_ioa(ioa1, ioa2)
-        except:
-            print (f" :heavy_exclamation_mark: Error: Word is not an integer: r{row['RTU']}:c{row['Card']}:w{row['Word']} ({row['GenericType']})")
-            return pd.Series({
-                'CASDU': row['CASDU'],
-                'IOA': None, 
-                'IOA1': None,
-                'IOA2': None,
-                'GenericPointAddress': None})
-        
-        return pd.Series({
-            'CASDU': row['CASDU'],
-            'IOA': str(ioa),
-            'IOA1': str(ioa1),
-            'IOA2': str(ioa2),
-            'GenericPointAddress': f"[{row['RTUId']}:{row['CASDU']}:{str(ioa)}-{CtrlText} {TypeText}]"
-        })
+def derive_addresses_for_habdde_export(df: pd.DataFrame) -> pd.DataFrame:
+    """Derive the CASDU, IOA, IOA1, IOA2 and GenericPointAddress columns for a habdde export."""
+    generic_type = df['GenericType'].astype(object)
+    is_control = generic_type.isin(['CTRL', 'SETPOINT'])
+    type_text = generic_type.where(~is_control, 'C').astype(str)
+
+    ctrl_text = pd.Series('', index=df.index, dtype=object)
+    if 'CtrlFunc' in df.columns and is_control.any():
+        ctrl_func = df['CtrlFunc'].astype(object)
+        blank_func = (ctrl_func == '') | np.equal(ctrl_func.to_numpy(), None)
+        generic_ctrl_id = convert_control_ids_to_generic_control_ids(ctrl_func, generic_type)
+        ctrl_text = ctrl_text.mask(is_control & ~blank_func, generic_ctrl_id)
+
+    rtu_id = df['RTUId'].astype(str)
+    is_mk2a = df['Protocol'] == 'MK2A'
+
+    ioa1 = convert_to_int_or_none(df['Card'])
+    ioa2 = convert_to_int_or_none(df['Word'])
+    is_valid = ~is_mk2a & ioa1.notna() & ioa2.notna()
+    is_invalid = ~is_mk2a & ~is_valid
+    for rtu, card, word, point_type in df.loc[is_invalid, ['RTU', 'Card', 'Word', 'GenericType']].itertuples(index=False, name=None):
+        print (f" :heavy_exclamation_mark: Error: Word is not an integer: r{rtu}:c{card}:w{word} ({point_type})")
+
+    addresses = pd.DataFrame({
+        'CASDU': df['CASDU'].astype(object).where(~is_mk2a, None),
+        'IOA': None,
+        'IOA1': None,
+        'IOA2': None,
+        'GenericPointAddress': None,
+    }, index=df.index, dtype=object)
+
+    if is_valid.any():
+        ioa1_valid = ioa1[is_valid].astype('int64')
+        ioa2_valid = ioa2[is_valid].astype('int64')
+        ioa = pd.Series(combine_ioa(ioa1_valid, ioa2_valid), index=ioa1_valid.index).astype(str)
+        addresses.loc[is_valid, 'IOA'] = ioa
+        addresses.loc[is_valid, 'IOA1'] = ioa1_valid.astype(str)
+        addresses.loc[is_valid, 'IOA2'] = ioa2_valid.astype(str)
+        addresses.loc[is_valid, 'GenericPointAddress'] = build_generic_point_address(rtu_id[is_valid], df.loc[is_valid, 'CASDU'].astype(str), ioa, ctrl_text[is_valid], type_text[is_valid])
+
+    if is_mk2a.any():
+        # only stringify the Card and Word of the MK2A rows
+        mk2a = df.loc[is_mk2a, ['Card', 'Word']].astype(str)
+        addresses.loc[is_mk2a, 'GenericPointAddress'] = build_generic_point_address(rtu_id[is_mk2a], mk2a['Card'], mk2a['Word'], ctrl_text[is_mk2a], type_text[is_mk2a])
+
+    return addresses
     
 
+# eTerra point export columns and their new names
+ETERRA_POINT_COLUMN_RENAMES = {
+    'sub': 'Sub',
+    'devtyp': 'DeviceType',
+    'device_id': 'DeviceId',
+    'device_name': 'DeviceName',
+    'point_id': 'PointId',
+    'point_name': 'PointName',
+    'area': 'eTerraZone',
+    'rtu': 'RTU',
+    'address1': 'CASDU',
+    'rtu_address': 'RTUAddress',
+    'card': 'Card',
+    'phyadr': 'Word',
+    'pnttyp': 'eTerraPtyType',
+    'sinvt': 'Inverted',
+    'protocol': 'Protocol',
+    'ctrlable': 'Controllable',
+}
+
+# eTerra point export columns to return - only the ones that exist are kept
+ETERRA_POINT_COLUMNS_TO_KEEP = [
+    'eTerraKey',
+    'eTerraAlias', 
+    'Sub',
+    'DeviceType',
+    'DeviceId',
+    'DeviceName',
+    'PointId',
+    'PointName',
+    'eTerraZone',
+    'RTU',
+    'RTUAddress',
+    'Card', 
+    'Word',
+    'CASDU',
+    'IOA',
+    'IOA1',
+    'IOA2',
+    'Size',
+    'Inverted',
+    'Protocol',
+    'Controllable',
+    'eTerraPtyType',
+    'RTUId',
+    'GenericPointAddress',
+    'GenericType',
+    'IGNORE_RTU',
+    'IGNORE_POINT',
+    'OLD_DATA',
+    'GridIncomer',
+    'eTerra Alias',
+    'ICCP_POINTNAME',
+    'ICCP->PO',
+    'ICCP_ALIAS',
+    'PowerOn Alias',
+    'PowerOn Alias Exists',
+    'PowerOn Alias Linked to SCADA',
+    'values',
+    'xdis', 
+    'sdis'
+]
+
 def clean_eterra_point_export(df: pd.DataFrame) -> pd.DataFrame:
     """Clean the eTerra point export dataframe."""
     # | Original Column     | New Column
@@ -152,109 +257,103 @@ def clean_eterra_point_export(df: pd.DataFrame) -> pd.DataFrame:
     # |                     | eTerraAlias : Sub/DeviceType/DeviceId/PointId
 
     # rename the columns to the new column names using the mapping in the New Column section - skip the columns that are not in the New Column section
-    df.rename(columns={
-        'sub': 'Sub',
-        'devtyp': 'DeviceType',
-        'device_id': 'DeviceId',
-        'device_name': 'DeviceName',
-        'point_id': 'PointId',
-        'point_name': 'PointName',
-        'area': 'eTerraZone',
-        'rtu': 'RTU',
-        'address1': 'CASDU',
-        'rtu_address': 'RTUAddress',
-        'card': 'Card',
-        'phyadr': 'Word',
-        'pnttyp': 'eTerraPtyType',
-        'sinvt': 'Inverted',
-        'protocol': 'Protocol',
-        'ctrlable': 'Controllable',
-    }, inplace=True)
+    df = df.rename(columns=ETERRA_POINT_COLUMN_RENAMES)
 
     # Derive the columns we need from the columns we have
-    df['eTerraAlias'] = df['Sub'] + '/' + df['DeviceType'] + '/' + df['DeviceId'] + '/' + df['PointId']
-    df['RTUId'] = '(' + df['RTU'] + ':' + df['RTUAddress'].astype(str) + ')'
+    add_eterra_alias_and_rtu_id(df)
 
     # Convert Size from 1->2 and 0->1
     # Convert concat_conect to int
     df['concat_conect'] = df['concat_conect'].astype(int)
-    df['Size'] = df['concat_conect'].apply(lambda x: 2 if x == 1 else 1 if x == 0 else x)
-
-    def derive_generic_type(row):
-        # look for Dummy Rows - Card and CASDU will be empty or Nan
-        if pd.isna(row['Card']) and pd.isna(row['CASDU']):
-            return 'DUMMY'
-        elif row['Size'] == 1:
-            return 'SD'
-        elif row['Size'] == 2:
-            return 'DD'
-        else:
-            return None
-
-    df['GenericType'] = df.apply(derive_generic_type, axis=1)
+    df['Size'] = np.where(df['concat_conect'] == 1, 2, np.where(df['concat_conect'] == 0, 1, df['concat_conect']))
 
-    df[['CASDU', 'IOA', 'IOA1', 'IOA2', 'GenericPointAddress']] = df.apply(derive_addresses_for_habdde_export, axis=1)
+    # Size 1 is SD and Size 2 is DD, anything else has no GenericType
+    generic_type = df['Size'].map({1: 'SD', 2: 'DD'}).astype(object)
+    # look for Dummy Rows - Card and CASDU will be empty or Nan
+    is_dummy = df['Card'].isna() & df['CASDU'].isna()
+    df['GenericType'] = generic_type.where(generic_type.notna(), None).mask(is_dummy, 'DUMMY')
 
-    # strip the eTerraKey of any leading or trailing whitespace
-    df['eTerraKey'] = df['eTerraKey'].str.strip()
+    add_habdde_addresses(df)
 
     # Only return the columns we need
     # We will only keep the columns in the New Column section
     # Only keep columns that exist in the dataframe
-    available_columns = [
-        'eTerraKey',
-        'eTerraAlias', 
-        'Sub',
-        'DeviceType',
-        'DeviceId',
-        'DeviceName',
-        'PointId',
-        'PointName',
-        'eTerraZone',
-        'RTU',
-        'RTUAddress',
-        'Card', 
-        'Word',
-        'CASDU',
-        'IOA',
-        'IOA1',
-        'IOA2',
-        'Size',
-        'Inverted',
-        'Protocol',
-        'Controllable',
-        'eTerraPtyType',
-        'RTUId',
-        'GenericPointAddress',
-        'GenericType',
-        'IGNORE_RTU',
-        'IGNORE_POINT',
-        'OLD_DATA',
-        'GridIncomer',
-        'eTerra Alias',
-        'ICCP_POINTNAME',
-        'ICCP->PO',
-        'ICCP_ALIAS',
-        'PowerOn Alias',
-        'PowerOn Alias Exists',
-        'PowerOn Alias Linked to SCADA',
-        'values',
-        'xdis', 
-        'sdis'
-    ]
-
-    # Only keep columns that exist in df to avoid KeyError
-    columns_to_keep = []
-    for col in available_columns:
-        if col in df.columns:
-            columns_to_keep.append(col)
-
-    # Ensure we have at least some columns before filtering
-    if len(columns_to_keep) > 0:
-        df = df[columns_to_keep]
-    else:
-        print("Warning: No matching columns found in dataframe")
-    return df
+    return finalize_habdde_export(df, ETERRA_POINT_COLUMNS_TO_KEEP, only_existing=True)
+
+# eTerra analog export columns and their new names
+ETERRA_ANALOG_COLUMN_RENAMES = {
+    'sub': 'Sub',
+    'devtyp': 'DeviceType',
+    'device_id': 'DeviceId',
+    'device_name': 'DeviceName',
+    'analog_id': 'PointId',
+    'lo_reas': 'LoReas',
+    'hi_reas': 'HiReas',
+    'area': 'eTerraZone',
+    'rtu': 'RTU',
+    'address1': 'CASDU',
+    'rtu_address': 'RTUAddress',
+    'card': 'Card',
+    'word': 'Word',
+    'rawhigh': 'RawHigh',
+    'rawlow': 'RawLow',
+    'enghigh': 'EngHigh',
+    'englow': 'EngLow',
+    'protocol': 'Protocol',
+    'clmpdbnd': 'ClmpDbnd',
+    'pospolar': 'PosPolar',
+    'negpolar': 'NegPolar',
+    'negate': 'Negate',
+    'itpnd': 'eTerraPtyType',
+}
+
+# eTerra analog export columns to return - only the ones that exist are kept
+ETERRA_ANALOG_COLUMNS_TO_KEEP = [
+    'eTerraKey',
+    'eTerraAlias',
+    'Sub',
+    'DeviceType',
+    'DeviceId',
+    'DeviceName',
+    'PointId',
+    'LoReas',
+    'HiReas',
+    'eTerraZone',
+    'RTU',
+    'RTUAddress',
+    'Card',
+    'Word',
+    'RawHigh',
+    'RawLow',
+    'EngHigh',
+    'EngLow',
+    'eTerraPtyType',
+    'Protocol',
+    'ClmpDbnd',
+    'PosPolar',
+    'NegPolar',
+    'Negate',
+    'RTUId',
+    'GenericPointAddress',
+    'GenericType',
+    'CASDU',
+    'IOA',
+    'IOA1',
+    'IOA2',
+    'Controllable' # Dummy field to make columns match digital columns
+    ,
+    'IGNORE_RTU',
+    'IGNORE_POINT',
+    'OLD_DATA',
+    'GridIncomer',
+    'eTerra Alias',
+    'ICCP_POINTNAME',
+    'ICCP->PO',
+    'ICCP_ALIAS',
+    'PowerOn Alias',
+    'PowerOn Alias Exists',
+    'PowerOn Alias Linked to SCADA'
+]
 
 def clean_eterra_analog_export(df: pd.DataFrame) -> pd.DataFrame:
     """Clean the eTerra analog export dataframe."""
@@ -298,44 +397,16 @@ def clean_eterra_analog_export(df: pd.DataFrame) -> pd.DataFrame:
     # |                         | eTerraAlias : Sub/DeviceType/DeviceId/PointId
 
     # rename the columns to the new column names using the mapping in the New Column section - skip the columns that are not in the New Column section
-    df.rename(columns={
-        'sub': 'Sub',
-        'devtyp': 'DeviceType',
-        'device_id': 'DeviceId',
-        'device_name': 'DeviceName',
-        'analog_id': 'PointId',
-        'lo_reas': 'LoReas',
-        'hi_reas': 'HiReas',
-        'area': 'eTerraZone',
-        'rtu': 'RTU',
-        'address1': 'CASDU',
-        'rtu_address': 'RTUAddress',
-        'card': 'Card',
-        'word': 'Word',
-        'rawhigh': 'RawHigh',
-        'rawlow': 'RawLow',
-        'enghigh': 'EngHigh',
-        'englow': 'EngLow',
-        'protocol': 'Protocol',
-        'clmpdbnd': 'ClmpDbnd',
-        'pospolar': 'PosPolar',
-        'negpolar': 'NegPolar',
-        'negate': 'Negate',
-        'itpnd': 'eTerraPtyType',
-    }, inplace=True)
+    df = df.rename(columns=ETERRA_ANALOG_COLUMN_RENAMES)
 
     # Derive the columns we need from the columns we have
-    df['eTerraAlias'] = df['Sub'] + '/' + df['DeviceType'] + '/' + df['DeviceId'] + '/' + df['PointId']
-    df['RTUId'] = '(' + df['RTU'] + ':' + df['RTUAddress'].astype(str) + ')'
+    add_eterra_alias_and_rtu_id(df)
 
     # Set the GenericType to A for all rows
     df['GenericType'] = 'A'
 
     # Derive the GenericPointAddress from the RTUId, Card, Word, and GenericType
-    df[['CASDU', 'IOA', 'IOA1', 'IOA2', 'GenericPointAddress']] = df.apply(derive_addresses_for_habdde_export, axis=1)
-
-    # strip the eTerraKey of any leading or trailing whitespace
-    df['eTerraKey'] = df['eTerraKey'].str.strip()
+    add_habdde_addresses(df)
 
     # Create a dummy Controllable field to make columns match digital columns, and set the Taps to controllable
     df['Controllable'] = '0'
@@ -343,55 +414,55 @@ def clean_eterra_analog_export(df: pd.DataFrame) -> pd.DataFrame:
 
     # Only return the columns we need
     # We will only keep the columns in the New Column section
-    available_columns = [
-        'eTerraKey',
-        'eTerraAlias',
-        'Sub',
-        'DeviceType',
-        'DeviceId',
-        'DeviceName',
-        'PointId',
-        'LoReas',
-        'HiReas',
-        'eTerraZone',
-        'RTU',
-        'RTUAddress',
-        'Card',
-        'Word',
-        'RawHigh',
-        'RawLow',
-        'EngHigh',
-        'EngLow',
-        'eTerraPtyType',
-        'Protocol',
-        'ClmpDbnd',
-        'PosPolar',
-        'NegPolar',
-        'Negate',
-        'RTUId',
-        'GenericPointAddress',
-        'GenericType',
-        'CASDU',
-        'IOA',
-        'IOA1',
-        'IOA2',
-        'Controllable' # Dummy field to make columns match digital columns
-        ,
-        'IGNORE_RTU',
-        'IGNORE_POINT',
-        'OLD_DATA',
-        'GridIncomer',
-        'eTerra Alias',
-        'ICCP_POINTNAME',
-        'ICCP->PO',
-        'ICCP_ALIAS',
-        'PowerOn Alias',
-        'PowerOn Alias Exists',
-        'PowerOn Alias Linked to SCADA'
-    ]
-    columns_to_keep = [col for col in available_columns if col in df.columns]
-    df = df[columns_to_keep]
-    return df
+    return finalize_habdde_export(df, ETERRA_ANALOG_COLUMNS_TO_KEEP, only_existing=True)
+
+# eTerra control export columns and their new names
+ETERRA_CONTROL_COLUMN_RENAMES = {
+    'sub': 'Sub',
+    'devtyp': 'DeviceType',
+    'device_id': 'DeviceId',
+    'device_name': 'DeviceName',
+    'point_id': 'PointId',
+    'control_id': 'ControlId',
+    'rtu': 'RTU',
+    'rtu_address': 'RTUAddress',
+    'card': 'Card',
+    'phyadr': 'Word',
+    'mdlparm1': 'Parm1',
+    'mdlparm2': 'Parm2',
+    'mdlparm3': 'Parm3',
+    'protocol': 'Protocol',
+    'ctrlfunc': 'CtrlFunc',
+    'address': 'CASDU',
+}
+
+# eTerra control export columns to return
+ETERRA_CONTROL_COLUMNS_TO_KEEP = [
+    'eTerraKey',
+    'eTerraAlias',
+    'Sub',
+    'DeviceType',
+    'DeviceId',
+    'DeviceName',
+    'PointId',
+    'ControlId',
+    'RTU',
+    'RTUAddress',
+    'Card',
+    'Word',
+    'Parm1',
+    'Parm2',
+    'Parm3',
+    'CtrlFunc',
+    'Protocol',
+    'RTUId',
+    'GenericPointAddress',
+    'GenericType',
+    'CASDU',
+    'IOA',
+    'IOA1',
+    'IOA2'
+]
 
 def clean_eterra_control_export(df: pd.DataFrame) -> pd.DataFrame:
     """Clean the eTerra control export dataframe."""
@@ -424,69 +495,60 @@ def clean_eterra_control_export(df: pd.DataFrame) -> pd.DataFrame:
     # |                         | eTerraAlias : Sub/DeviceType/DeviceId/PointId
 
     # rename the columns to the new column names using the mapping in the New Column section - skip the columns that are not in the New Column section
-    df.rename(columns={
-        'sub': 'Sub',
-        'devtyp': 'DeviceType',
-        'device_id': 'DeviceId',
-        'device_name': 'DeviceName',
-        'point_id': 'PointId',
-        'control_id': 'ControlId',
-        'rtu': 'RTU',
-        'rtu_address': 'RTUAddress',
-        'card': 'Card',
-        'phyadr': 'Word',
-        'mdlparm1': 'Parm1',
-        'mdlparm2': 'Parm2',
-        'mdlparm3': 'Parm3',
-        'protocol': 'Protocol',
-        'ctrlfunc': 'CtrlFunc',
-        'address': 'CASDU',
-    }, inplace=True)
+    df = df.rename(columns=ETERRA_CONTROL_COLUMN_RENAMES)
 
     # Derive the columns we need from the columns we have
-    df['eTerraAlias'] = df['Sub'] + '/' + df['DeviceType'] + '/' + df['DeviceId'] + '/' + df['PointId']
-    df['RTUId'] = '(' + df['RTU'] + ':' + df['RTUAddress'].astype(str) + ')'
+    add_eterra_alias_and_rtu_id(df)
 
     # Set the GenericType to CTRL for all rows
     df['GenericType'] = 'CTRL'
 
     # Derive the GenericPointAddress from the RTUId, Card, Word, and GenericType
-    df[['CASDU', 'IOA', 'IOA1', 'IOA2', 'GenericPointAddress']] = df.apply(derive_addresses_for_habdde_export, axis=1)
-
-    # strip the eTerraKey of any leading or trailing whitespace
-    df['eTerraKey'] = df['eTerraKey'].str.strip()
+    add_habdde_addresses(df)
 
     # Only return the columns we need
     # We will only keep the columns in the New Column section
-    columns_to_keep = [
-        'eTerraKey',
-        'eTerraAlias',
-        'Sub',
-        'DeviceType',
-        'DeviceId',
-        'DeviceName',
-        'PointId',
-        'ControlId',
-        'RTU',
-        'RTUAddress',
-        'Card',
-        'Word',
-        'Parm1',
-        'Parm2',
-        'Parm3',
-        'CtrlFunc',
-        'Protocol',
-        'RTUId',
-        'GenericPointAddress',
-        'GenericType',
-        'CASDU',
-        'IOA',
-        'IOA1',
-        'IOA2'
-    ]
-    
-    df = df[columns_to_keep]
-    return df
+    return finalize_habdde_export(df, ETERRA_CONTROL_COLUMNS_TO_KEEP)
+
+# eTerra setpoint control export columns and their new names
+ETERRA_SETPOINT_CONTROL_COLUMN_RENAMES = {
+    'sub': 'Sub',
+    'devtyp': 'DeviceType',
+    'device_id': 'DeviceId',
+    'device_name': 'DeviceName',
+    'analog_id': 'PointId',
+    'rtu': 'RTU',
+    'rtu_address': 'RTUAddress',
+    'address1': 'CASDU',
+    'card': 'IOA1',
+    'phyadr': 'IOA2',
+    'protocol': 'Protocol',
+    'mdlparm2': 'CtrlFunc',
+    'enghigh': 'EngHigh',
+    'englow': 'EngLow',
+}
+
+# eTerra setpoint control export columns to return
+ETERRA_SETPOINT_CONTROL_COLUMNS_TO_KEEP = [
+    'eTerraKey',
+    'eTerraAlias',
+    'Sub',
+    'DeviceType',
+    'DeviceId',
+    'DeviceName',
+    'PointId',
+    'RTU',
+    'RTUAddress',
+    'CASDU',
+    'IOA1',
+    'IOA2',
+    'CtrlFunc',
+    'EngHigh',
+    'EngLow',
+    'Protocol',
+    'GenericPointAddress',
+    'GenericType'
+]
 
 def clean_eterra_setpoint_control_export(df: pd.DataFrame) -> pd.DataFrame:
     """Clean the eTerra setpoint control export dataframe."""
@@ -522,65 +584,24 @@ def clean_eterra_setpoint_control_export(df: pd.DataFrame) -> pd.DataFrame:
     # |                    | eTerraAlias : Sub/DeviceType/DeviceId/PointId
 
     # rename the columns to the new column names using the mapping in the New Column section - skip the columns that are not in the New Column section
-    df.rename(columns={
-        'sub': 'Sub',
-        'devtyp': 'DeviceType',
-        'device_id': 'DeviceId',
-        'device_name': 'DeviceName',
-        'analog_id': 'PointId',
-        'rtu': 'RTU',
-        'rtu_address': 'RTUAddress',
-        'address1': 'CASDU',
-        'card': 'IOA1',
-        'phyadr': 'IOA2',
-        'protocol': 'Protocol',
-        'mdlparm2': 'CtrlFunc',
-        'enghigh': 'EngHigh',
-        'englow': 'EngLow',
-    }, inplace=True)
+    df = df.rename(columns=ETERRA_SETPOINT_CONTROL_COLUMN_RENAMES)
 
     # Set the GenericType to C for all rows
     df['GenericType'] = 'SETPOINT'
 
     # Derive the GenericPointAddress from the RTUId, Card, Word, and GenericType
-    df['RTUId'] = '(' + df['RTU'] + ':' + df['RTUAddress'].astype(str) + ')'
-    df['eTerraAlias'] = df['Sub'] + '/' + df['DeviceType'] + '/' + df['DeviceId'] + '/' + df['PointId']
+    add_eterra_alias_and_rtu_id(df)
 
     # Set the card and word for compatibility with common functions
     df['Card'] = df['IOA1']
     df['Word'] = df['IOA2']
 
     # Derive the GenericPointAddress from the RTUId, CASDU, IOA1, IOA2, and GenericType
-    df[['CASDU', 'IOA', 'IOA1', 'IOA2', 'GenericPointAddress']] = df.apply(derive_addresses_for_habdde_export, axis=1)
-
-    # strip the eTerraKey of any leading or trailing whitespace
-    df['eTerraKey'] = df['eTerraKey'].str.strip()
+    add_habdde_addresses(df)
     
     # Only return the columns we need
     # We will only keep the columns in the New Column section
-    columns_to_keep = [
-        'eTerraKey',
-        'eTerraAlias',
-        'Sub',
-        'DeviceType',
-        'DeviceId',
-        'DeviceName',
-        'PointId',
-        'RTU',
-        'RTUAddress',
-        'CASDU',
-        'IOA1',
-        'IOA2',
-        'CtrlFunc',
-        'EngHigh',
-        'EngLow',
-        'Protocol',
-        'GenericPointAddress',
-        'GenericType'
-    ]
-    
-    df = df[columns_to_keep]
-    return df
+    return finalize_habdde_export(df, ETERRA_SETPOINT_CONTROL_COLUMNS_TO_KEEP)
 
 def add_control_info_to_eterra_export(eterra_export: pd.DataFrame, eterra_control_export: pd.DataFrame, eterra_setpoint_control_export: pd.DataFrame, all_rtus: pd.DataFrame, controls_test: pd.DataFrame, manual_commissioning: pd.DataFrame) -> pd.DataFrame:
     """Add control info to the eterra export dataframe."""
@@ -598,90 +619,60 @@ def add_control_info_to_eterra_export(eterra_export: pd.DataFrame, eterra_contro
      - "SETPNT" -> Ctrl1Name
     '''
 
-    def get_control_info(row):
-        # Get the control info from the eterra control and eterra setpoint control dataframes
-        # if the point id is TCP then edit the eTerraAlias to swap TCP for TAP
-        if row['PointId'] == 'TCP':
-            row['eTerraAlias'] = row['eTerraAlias'].replace('TCP', 'TAP')
-
-        control_info = eterra_control_export[eterra_control_export['eTerraAlias'] == row['eTerraAlias']]
-
-        # if the point id is TCP then edit the eTerraAlias to swap back to TCP
-        if row['PointId'] == 'TCP':
-            control_info.loc[:,'eTerraAlias'] = control_info['eTerraAlias'].replace('TAP', 'TCP')
-
-        return control_info 
-    
-    def get_setpoint_control_info(row):
-        # Get the control info from the eterra setpoint control dataframe
-        control_info = eterra_setpoint_control_export[eterra_setpoint_control_export['eTerraAlias'] == row['eTerraAlias']]
-        return control_info
-    
-    def get_control_po_config(row, all_rtus: pd.DataFrame):
-        pass
-
-    # For each row in the eterra export dataframe, add the control info from the eterra control and eterra setpoint control dataframes
-    for _, row in eterra_export.iterrows():
-
-        # Initialize the Ctrl1Addr and Ctrl1Name columns
-        eterra_export.at[_, 'Ctrl1Addr'] = ''
-        eterra_export.at[_, 'Ctrl1Name'] = ''
-        eterra_export.at[_, 'Ctrl1SecureBit'] = ''
-        eterra_export.at[_, 'Ctrl1SyncChannel'] = ''
-        eterra_export.at[_, 'Ctrl1IECSingleDouble'] = ''
-        eterra_export.at[_, 'Ctrl1Func'] = ''
-        eterra_export.at[_, 'Ctrl2Addr'] = ''
-        eterra_export.at[_, 'Ctrl2Name'] = ''
-        eterra_export.at[_, 'Ctrl2SecureBit'] = ''
-        eterra_export.at[_, 'Ctrl2SyncChannel'] = ''
-        eterra_export.at[_, 'Ctrl2IECSingleDouble'] = ''
-        eterra_export.at[_, 'Ctrl2Func'] = ''
-
-        if row['Controllable'] == '1':
-            # Get the control info from the eterra control and eterra setpoint control dataframes
-            control_info = get_control_info(row)
-
-            # check how many controls are in the control_info dataframe
-            if control_info.shape[0] > 0:
-                # Add the first control info to the eterra export dataframe
-                eterra_export.at[_, 'Ctrl1Addr'] = control_info.iloc[0]['GenericPointAddress']
-                eterra_export.at[_, 'Ctrl1Name'] = control_info.iloc[0]['ControlId']
-                eterra_export.at[_, 'Ctrl1Func'] = control_info.iloc[0]['CtrlFunc']
-                # for Mk2a controls, the secure bit is in mdlparm1, the sync channel is in mdlparm2, for IEC controls, the IEC single/double is in mdlparm2
-                if control_info.iloc[0]['Protocol'] == 'MK2A':
-                    eterra_export.at[_, 'Ctrl1SecureBit'] = control_info.iloc[0]['Parm1']
-                    eterra_export.at[_, 'Ctrl1SyncChannel'] = control_info.iloc[0]['Parm2']
-                else:
-                    eterra_export.at[_, 'Ctrl1IECSingleDouble'] = control_info.iloc[0]['Parm2']
-                    # if the control is a CLOSE control, look for a matching SC1E point and set the Ctrl1SyncChannel to 1
-                    if control_info.iloc[0]['ControlId'] == 'CLOSE':
-                        sc1e_point = eterra_export[eterra_export['eTerraAlias'] == row['eTerraAlias'].replace('SWDD', 'SC1E')]
-                        if sc1e_point.shape[0] > 0:
-                            eterra_export.at[_, 'Ctrl1SyncChannel'] = 1
-
-            if control_info.shape[0] > 1:
-                # Add the second control info to the eterra export dataframe
-                eterra_export.at[_, 'Ctrl2Addr'] = control_info.iloc[1]['GenericPointAddress']
-                eterra_export.at[_, 'Ctrl2Name'] = control_info.iloc[1]['ControlId']
-                eterra_export.at[_, 'Ctrl2Func'] = control_info.iloc[1]['CtrlFunc']
-                if control_info.iloc[1]['Protocol'] == 'MK2A':
-                    eterra_export.at[_, 'Ctrl2SecureBit'] = control_info.iloc[1]['Parm1']
-                    eterra_export.at[_, 'Ctrl2SyncChannel'] = control_info.iloc[1]['Parm2']
-                else:
-                    eterra_export.at[_, 'Ctrl2IECSingleDouble'] = control_info.iloc[1]['Parm2']
-                    # if the control is a CLOSE control, look for a matching SC1E point and set the Ctrl2SyncChannel to 1
-                    if control_info.iloc[1]['ControlId'] == 'CLOSE':
-                        sc1e_point = eterra_export[eterra_export['eTerraAlias'] == row['eTerraAlias'].replace('SWDD', 'SC1E')]
-                        if sc1e_point.shape[0] > 0:
-                            eterra_export.at[_, 'Ctrl2SyncChannel'] = 1
-
-        if row['GenericType'] == 'A':
-            # Get the control info from the eterra setpoint control dataframe
-            control_info = get_setpoint_control_info(row)
-            # Add the control info to the eterra setpoint control dataframe
-            if control_info.shape[0] > 0:
-                eterra_export.at[_, 'Ctrl1Addr'] = control_info.iloc[0]['GenericPointAddress']
-                eterra_export.at[_, 'Ctrl1Name'] = 'SETPOINT'
+    ctrl_columns = {f'Ctrl{n}{field}': np.full(len(eterra_export), '', dtype=object)
+                    for n in (1, 2) for field in ['Addr', 'Name', 'SecureBit', 'SyncChannel', 'IECSingleDouble', 'Func']}
+
+    eterra_alias = eterra_export['eTerraAlias'].astype(object)
+    is_controllable = (eterra_export['Controllable'] == '1').to_numpy()
+
+    # if the point id is TCP then look up the controls with the eTerraAlias swapped from TCP to TAP
+    lookup_alias = eterra_alias.copy()
+    swap_tcp = is_controllable & (eterra_export['PointId'] == 'TCP').to_numpy()
+    lookup_alias[swap_tcp] = eterra_alias[swap_tcp].str.replace('TCP', 'TAP', regex=False)
+
+    # points with a matching SC1E point get sync channel 1 on their IEC CLOSE controls
+    has_sc1e_point = (lookup_alias.notna() & lookup_alias.str.replace('SWDD', 'SC1E', regex=False).isin(eterra_alias)).to_numpy()
+
+    # number each point's controls in file order - the first goes in Ctrl1, the second in Ctrl2
+    controls = eterra_control_export[eterra_control_export['eTerraAlias'].notna()]
+    control_number = controls.groupby('eTerraAlias', sort=False).cumcount().to_numpy()
+
+    for n in (1, 2):
+        nth_controls = controls[control_number == n - 1]
+        positions = pd.Index(nth_controls['eTerraAlias']).get_indexer(lookup_alias)
+        has_control = is_controllable & (positions >= 0)
+        rows = positions[has_control]
+
+        def control_values(column):
+            return nth_controls[column].to_numpy(dtype=object)[rows]
+
+        ctrl_columns[f'Ctrl{n}Addr'][has_control] = control_values('GenericPointAddress')
+        ctrl_columns[f'Ctrl{n}Name'][has_control] = control_values('ControlId')
+        ctrl_columns[f'Ctrl{n}Func'][has_control] = control_values('CtrlFunc')
+
+        # for Mk2a controls, the secure bit is in mdlparm1, the sync channel is in mdlparm2, for IEC controls, the IEC single/double is in mdlparm2
+        is_mk2a = control_values('Protocol') == 'MK2A'
+        parm1 = control_values('Parm1')
+        parm2 = control_values('Parm2')
+        is_sync_close = ~is_mk2a & (control_values('ControlId') == 'CLOSE') & has_sc1e_point[has_control]
+
+        targets = np.flatnonzero(has_control)
+        ctrl_columns[f'Ctrl{n}SecureBit'][targets[is_mk2a]] = parm1[is_mk2a]
+        ctrl_columns[f'Ctrl{n}SyncChannel'][targets[is_mk2a]] = parm2[is_mk2a]
+        ctrl_columns[f'Ctrl{n}IECSingleDouble'][targets[~is_mk2a]] = parm2[~is_mk2a]
+        # if an IEC control is a CLOSE control and there is a matching SC1E point, set the sync channel to 1
+        ctrl_columns[f'Ctrl{n}SyncChannel'][targets[is_sync_close]] = 1
+
+    # Analogs take the first matching setpoint control (looked up by the same alias as the controls)
+    setpoints = eterra_setpoint_control_export[eterra_setpoint_control_export['eTerraAlias'].notna()]
+    setpoints = setpoints.drop_duplicates(subset='eTerraAlias', keep='first')
+    positions = pd.Index(setpoints['eTerraAlias']).get_indexer(lookup_alias)
+    has_setpoint = (eterra_export['GenericType'] == 'A').to_numpy() & (positions >= 0)
+    ctrl_columns['Ctrl1Addr'][has_setpoint] = setpoints['GenericPointAddress'].to_numpy(dtype=object)[positions[has_setpoint]]
+    ctrl_columns['Ctrl1Name'][has_setpoint] = 'SETPOINT'
+
+    for column, values in ctrl_columns.items():
+        eterra_export[column] = values
 
     return eterra_export
 
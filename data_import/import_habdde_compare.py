@@ -1,4 +1,19 @@
 import pandas as pd
+from data_import.utils import keep_columns
+
+# habdde compare columns and their new names
+HABDDE_COMPARE_COLUMN_RENAMES = {
+    'matched_status': 'HbddeCompareStatus',
+    'GenericPointAddress': 'GenericPointAddress',
+    'Key': 'HabCompKey'
+}
+
+# habdde compare columns to return
+HABDDE_COMPARE_COLUMNS_TO_KEEP = [
+    'HbddeCompareStatus',
+    'GenericPointAddress',
+    'HabCompKey'
+]
 
 def clean_habdde_compare(df: pd.DataFrame) -> pd.DataFrame:
     """Clean the habdde compare dataframe."""
@@ -74,19 +89,9 @@ def clean_habdde_compare(df: pd.DataFrame) -> pd.DataFrame:
     # | PO Protocol             | 
     
     # rename the columns to the new column names using the mapping in the New Column section - skip the columns that are not in the New Column section
-    df.rename(columns={
-        'matched_status': 'HbddeCompareStatus',
-        'GenericPointAddress': 'GenericPointAddress',
-        'Key': 'HabCompKey'
-    }, inplace=True)
+    df = df.rename(columns=HABDDE_COMPARE_COLUMN_RENAMES)
 
     # Only return the columns we need
     # We will only keep the columns in the New Column section
-    columns_to_keep = [
-        'HbddeCompareStatus',
-        'GenericPointAddress',
-        'HabCompKey'
-    ]
-
-    df = df[columns_to_keep]
+    df = keep_columns(df, HABDDE_COMPARE_COLUMNS_TO_KEEP)
     return df
\ No newline at end of file
@@ -1,5 +1,20 @@
 import pandas as pd
 
+MANUAL_COMMISSIONING_COLUMN_RENAMES = {
+    'testset': 'CommissioningTestset',
+    'testdate': 'CommissioningTestdate',
+    'user': 'CommissioningUser',
+    'control_address': 'CommissioningControlAddress',
+    'test_name': 'CommissioningTestName',
+    'result': 'CommissioningResult',
+    'comments': 'CommissioningComments',
+    'RTUname': 'CommissioningRTUname',
+    'voltage_group': 'CommissioningVoltageGroup',
+    'test_area': 'CommissioningTestArea',
+    'alias': 'CommissioningAlias'
+}
+
+
 def clean_manual_commissioning(df: pd.DataFrame) -> pd.DataFrame:
     """Clean the manual commissioning dataframe."""
     # | Original Column         | New Column
@@ -16,19 +31,6 @@ def clean_manual_commissioning(df: pd.DataFrame) -> pd.DataFrame:
     # | test_area               | CommissioningTestArea
     # | alias                   | CommissioningAlias
 
-    df.rename(columns={
-        'testset': 'CommissioningTestset',
-        'testdate': 'CommissioningTestdate',
-        'user': 'CommissioningUser',
-        'control_address': 'CommissioningControlAddress',
-        'test_name': 'CommissioningTestName',
-        'result': 'CommissioningResult',
-        'comments': 'CommissioningComments',
-        'RTUname': 'CommissioningRTUname',
-        'voltage_group': 'CommissioningVoltageGroup',
-        'test_area': 'CommissioningTestArea',
-        'alias': 'CommissioningAlias'
-    }, inplace=True)
-
+    df = df.rename(columns=MANUAL_COMMISSIONING_COLUMN_RENAMES)
 
     return df
@@ -1,10 +1,96 @@
 import pandas as pd
 from data_import.utils import (
-    derive_generic_address_for_poweron_export,
-    split_ioa,
-    compute_offset
+    add_poweron_generic_address,
+    join_columns,
+    keep_columns,
+    split_ioa_column,
+    compute_offset_column
 )
 
+# The all_rtus.csv columns we use and their new names - only these columns need to be read from the file
+POWERON_COLUMN_RENAMES = {
+    'Protocol': 'Protocol',
+    'RTU': 'PO_RTU',
+    'RTU Address': 'RTUAddress',
+    'eterra_sub': 'Sub',
+    'eterra_dev_type': 'DeviceType',
+    'eterra_dev_id': 'DeviceId',
+    'eterra_point_id': 'PointId',
+    'addr1': 'Card',
+    'addr2': 'Word',
+    'comp_alias': 'POAlias',
+    'comp_name': 'POName',
+    'control_val': 'ControlId',
+    'config_extra_info': 'ConfigInfo',
+    'config_health': 'ConfigHealth',
+    'desc': 'PODescription',
+    'recordType': 'POType',
+    'scan_row': 'ScanInputRow',
+    'interpretation': 'POInterpretation',
+    'shift': 'Shift',
+    'siref1': 'ScanInputRef',
+    'size': 'Size',
+    'symbol_menu': 'Menu',
+    'symbol_name': 'Symbol',
+    'telecontrol_action': 'TC Action',
+    'user_tag': 'UserTag'
+}
+
+# PowerOn record type -> GenericType, anything else is 'Unknown'
+POTYPE_TO_GENERIC_TYPE = {
+    'A1': 'A',
+    'A2': 'A',
+    'A4': 'A',
+    'DI': 'SD',
+    'DD': 'DD',
+    'DO': 'C',
+    'AO': 'SETPOINT'
+}
+
+# Low cardinality PowerOn columns - stored as categoricals once the string columns have been built from them
+POWERON_CATEGORICAL_COLUMNS = ['PO_Protocol', 'PO_RTU', 'POType', 'PO_GenericType', 'ConfigHealth']
+
+# PowerOn columns to return
+POWERON_COLUMNS_TO_KEEP = [
+    'PO_Protocol',
+    'PO_RTU',
+    'PO_Card',
+    'PO_Word',
+    'PO_IOA1',
+    'PO_IOA2',
+    'PO_Offset',
+    'POAlias',
+    'POName',
+    'ConfigInfo',
+    'ConfigHealth',
+    'PODescription',
+    'POType',
+    'ScanInputRow',
+    'Shift',
+    'ScanInputRef',
+    'UserTag',
+    'Size',
+    'POInterpretation',
+    'Menu',
+    'Symbol',
+    'TC Action',
+    'PO_GenericType',
+    'GenericPointAddress',
+    'PO_eTerraAlias'
+]
+
+# PowerOn columns renamed to unique names before they are merged with the eTerra data
+POWERON_UNIQUE_COLUMN_RENAMES = {
+    'Protocol': 'PO_Protocol',
+    'Card': 'PO_Card',
+    'Word': 'PO_Word',
+    'IOA1': 'PO_IOA1',
+    'IOA2': 'PO_IOA2',
+    'Offset': 'PO_Offset',
+    'GenericType': 'PO_GenericType',
+    'eTerraAlias': 'PO_eTerraAlias'
+}
+
 def clean_all_rtus(df: pd.DataFrame) -> pd.DataFrame:
     """Clean the all rtus dataframe."""
     # | Original Column         | New Column
@@ -54,106 +140,27 @@ def clean_all_rtus(df: pd.DataFrame) -> pd.DataFrame:
     # |                         | eTerraAlias
 
     # rename the columns to the new column names using the mapping in the New Column section - skip the columns that are not in the New Column section
-    df.rename(columns={
-        'Protocol': 'Protocol',
-        'RTU': 'PO_RTU',
-        'RTU Address': 'RTUAddress',
-        'eterra_sub': 'Sub',
-        'eterra_dev_type': 'DeviceType',
-        'eterra_dev_id': 'DeviceId',
-        'eterra_point_id': 'PointId',
-        'addr1': 'Card',
-        'addr2': 'Word',
-        'comp_alias': 'POAlias',
-        'comp_name': 'POName',
-        'control_val': 'ControlId',
-        'config_extra_info': 'ConfigInfo',
-        'config_health': 'ConfigHealth',
-        'desc': 'PODescription',
-        'recordType': 'POType',
-        'scan_row': 'ScanInputRow',
-        'interpretation': 'POInterpretation',
-        'shift': 'Shift',
-        'siref1': 'ScanInputRef',
-        'size': 'Size',
-        'symbol_menu': 'Menu',
-        'symbol_name': 'Symbol',
-        'telecontrol_action': 'TC Action',
-        'user_tag': 'UserTag'
-    }, inplace=True)
-
-    def derive_generic_type_from_po_type(po_type):
-        if po_type in ['A1', 'A2', 'A4']:
-            return 'A'
-        elif po_type == 'DI':
-            return 'SD'
-        elif po_type == 'DD':
-            return 'DD'
-        elif po_type == 'DO':
-            return 'C'
-        elif po_type == 'AO':
-            return 'SETPOINT'
-        else:
-            return 'Unknown'
-        
+    df = df.rename(columns=POWERON_COLUMN_RENAMES)
+
     # Derive the GenericType from the POType
-    df['GenericType'] = df['POType'].apply(derive_generic_type_from_po_type)
+    df['GenericType'] = df['POType'].map(POTYPE_TO_GENERIC_TYPE).fillna('Unknown')
 
     # Derive the GenericPointAddress from the RTUId, Card, Word, and GenericType
     df['RTU'] = df['PO_RTU'].str.replace('_RTU', '')
-    df['RTUId'] = '(' + df['RTU'] + ':' + df['RTUAddress'].astype(str) + ')'
-    df['eTerraAlias'] = df['Sub'] + '/' + df['DeviceType'] + '/' + df['DeviceId'] + '/' + df['PointId']
+    df['RTUId'] = join_columns([df['RTU'], df['RTUAddress'].astype(str)], ':', prefix='(', suffix=')')
+    df['eTerraAlias'] = join_columns([df['Sub'], df['DeviceType'], df['DeviceId'], df['PointId']], '/')
 
     # Set the card and word for compatibility with common functions
     df['CASDU'] = df['Card']
     df['IOA'] = df['Word']
-    df[['IOA1', 'IOA2']] = df.apply(split_ioa, axis=1, result_type='expand')
-    df['Offset'] = df.apply(compute_offset, axis=1)
+    df['IOA1'], df['IOA2'] = split_ioa_column(df)
+    df['Offset'] = compute_offset_column(df)
 
     # Derive the GenericPointAddress from the RTUId, CASDU, IOA1, IOA2, and GenericType
-    df[['GenericPointAddress']] = df.apply(derive_generic_address_for_poweron_export, axis=1)
+    add_poweron_generic_address(df)
 
     # Change a few columns to unique names before we return this dataframe
-    df.rename(columns={
-        'Protocol': 'PO_Protocol',
-        'Card': 'PO_Card',
-        'Word': 'PO_Word',
-        'IOA1': 'PO_IOA1',
-        'IOA2': 'PO_IOA2',
-        'Offset': 'PO_Offset',
-        'GenericType': 'PO_GenericType',
-        'eTerraAlias': 'PO_eTerraAlias'
-    }, inplace=True)
-
-    # Only return the columns we need
-    # We will only keep the columns in the New Column section
-    columns_to_keep = [
-        'PO_Protocol',
-        'PO_RTU',
-        'PO_Card',
-        'PO_Word',
-        'PO_IOA1',
-        'PO_IOA2',
-        'PO_Offset',
-        'POAlias',
-        'POName',
-        'ConfigInfo',
-        'ConfigHealth',
-        'PODescription',
-        'POType',
-        'ScanInputRow',
-        'Shift',
-        'ScanInputRef',
-        'UserTag',
-        'Size',
-        'POInterpretation',
-        'Menu',
-        'Symbol',
-        'TC Action',
-        'PO_GenericType',
-        'GenericPointAddress',
-        'PO_eTerraAlias'
-    ]
+    df = df.rename(columns=POWERON_UNIQUE_COLUMN_RENAMES)
 
     # convert PO_Card to an int then a string
     try:
@@ -179,7 +186,9 @@ def clean_all_rtus(df: pd.DataFrame) -> pd.DataFrame:
     except:
         pass
 
-    df = df[columns_to_keep]
+    # Only return the columns we need
+    # We will only keep the columns in the New Column section
+    df = keep_columns(df, POWERON_COLUMNS_TO_KEEP)
 
     # We have had some issues with the eTerra source data that can result in duplciate rows in the all_rtus.csv file. 
 
@@ -229,5 +238,4 @@ def clean_all_rtus(df: pd.DataFrame) -> pd.DataFrame:
             print("Exiting...")
             exit()
 
-
-    return df
+    return df.astype({col: 'category' for col in POWERON_CATEGORICAL_COLUMNS})
@@ -1,13 +1,28 @@
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from typing import List, Dict, Optional
 from pathlib import Path
 
-def filter_data_by_rtu(df: pd.DataFrame, rtu_name: str) -> pd.DataFrame:
-    """Filter dataframe by RTU name."""
+def build_rtu_index(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Build a lookup of RTU name to row positions, for filtering the same dataframe by many RTUs."""
+    return df.groupby('RTU', sort=False, observed=True).indices
+
+def build_substation_index(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Build a lookup of substation to row positions, for filtering the same dataframe by many substations."""
+    return df.groupby('Sub', sort=False, observed=True).indices
+
+def filter_data_by_rtu(df: pd.DataFrame, rtu_name: str, rtu_index: Optional[Dict[str, np.ndarray]] = None) -> pd.DataFrame:
+    """Filter dataframe by RTU name. Pass an index from build_rtu_index when filtering by many RTUs."""
+    if rtu_index is not None:
+        return df.iloc[rtu_index.get(rtu_name, [])]
     return df[df['RTU'] == rtu_name]
 
-def filter_data_by_substation(df: pd.DataFrame, substation: str) -> pd.DataFrame:
-    """Filter dataframe by substation."""
+def filter_data_by_substation(df: pd.DataFrame, substation: str, substation_index: Optional[Dict[str, np.ndarray]] = None) -> pd.DataFrame:
+    """Filter dataframe by substation. Pass an index from build_substation_index when filtering by many substations."""
+    if substation_index is not None:
+        return df.iloc[substation_index.get(substation, [])]
     return df[df['Sub'] == substation]
 
 
@@ -24,6 +39,45 @@ def filter_data_by_substation(df: pd.DataFrame, substation: str) -> pd.DataFrame
 # [(ARIE3:33053):312:203- A]
 # [(AREC:141):252:6-1 C]
 
+def join_columns(columns: List[pd.Series], sep: str, prefix: str = '', suffix: str = '') -> pd.Series:
+    """
+    Join string columns row by row with sep (and an optional prefix/suffix) in one pass.
+    Matches chaining the columns with + : rows with a missing value in any column are NaN.
+    """
+    complete = np.logical_and.reduce([col.notna().to_numpy() for col in columns])
+    joined = np.full(len(complete), np.nan, dtype=object)
+    joined[complete] = [prefix + sep.join(parts) + suffix for parts in zip(*(col.to_numpy(dtype=object)[complete] for col in columns))]
+    return pd.Series(joined, index=columns[0].index)
+
+def build_generic_point_address(rtu_id: pd.Series, addr1: pd.Series, addr2: pd.Series, ctrl_text: pd.Series, generic_type: pd.Series) -> pd.Series:
+    """
+    Build GenericPointAddress strings - [RTUId:addr1:addr2-CtrlText GenericType] - from string columns.
+    The joins run as arrow kernels rather than python string concatenation.
+    Missing parts are written as 'None', as the f-string this replaced did.
+    """
+    parts = [pa.array(col.to_numpy(dtype=object), type=pa.string(), from_pandas=True) for col in (rtu_id, addr1, addr2, ctrl_text, generic_type)]
+    join_options = pc.JoinOptions(null_handling='replace', null_replacement='None')
+    location = pc.binary_join_element_wise(parts[0], parts[1], parts[2], ':', options=join_options)
+    point = pc.binary_join_element_wise(parts[3], parts[4], ' ', options=join_options)
+    addresses = pc.binary_join_element_wise('[', location, '-', point, ']', '')
+    return pd.Series(addresses.to_numpy(zero_copy_only=False), index=rtu_id.index, dtype=object)
+
+def strip_column(values: pd.Series) -> pd.Series:
+    """Strip leading/trailing whitespace like Series.str.strip, but only once per distinct value."""
+    codes, uniques = pd.factorize(values)
+    stripped = pd.Series(uniques, dtype=values.dtype).str.strip().to_numpy(dtype=object)
+    # missing values are left as they are
+    result = values.to_numpy(dtype=object, copy=True)
+    result[codes >= 0] = stripped[codes[codes >= 0]]
+    return pd.Series(result, index=values.index, name=values.name)
+
+def keep_columns(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Project df onto columns (in that order) - under Copy-on-Write the column data is not copied. Raises KeyError like df[columns] for missing columns."""
+    missing = [col for col in columns if col not in df.columns]
+    if missing:
+        raise KeyError(f"{missing} not in index")
+    return df.reindex(columns=columns)
+
 def ignore_habbde_point(row):
     # check if 'PointName' key exists
     if 'PointName' in row:
@@ -44,127 +98,128 @@ def get_controllable_for_taps(pointid: str):
         return '0'
 
 
-def derive_rtu_address_and_protocol_from_po_rtu_name(row, eterra_rtu_map: pd.DataFrame):
-    # get the eTerra ERU name by removing the text _RTU from the PO_RTU column
-    eterra_rtu_name = row['RTU'].replace('_RTU', '')
-    # get the rtu_address and protocol from the eterra_rtu_map dataframe
-    eterra_rtu_map_row = eterra_rtu_map[eterra_rtu_map['RTU'] == eterra_rtu_name]
-    if eterra_rtu_map_row.empty:
-        return None, None
-    return eterra_rtu_map_row['RTUAddress'].values[0], eterra_rtu_map_row['Protocol'].values[0]
+def attach_rtu_address_and_protocol(df: pd.DataFrame, eterra_rtu_map: pd.DataFrame) -> pd.DataFrame:
+    """Add the RTUAddress and Protocol columns by looking up the eTerra RTU name (PO RTU name without _RTU) in the eterra_rtu_map."""
+    # get the eTerra RTU name by removing the text _RTU from the PO RTU column
+    eterra_rtu_name = df['RTU'].str.replace('_RTU', '', regex=False)
+    # use the first entry for each RTU, matching a row by row lookup of the map
+    rtu_map = eterra_rtu_map.drop_duplicates(subset='RTU').set_index('RTU')
+    found = eterra_rtu_name.isin(rtu_map.index)
+    for col in ['RTUAddress', 'Protocol']:
+        df[col] = eterra_rtu_name.map(rtu_map[col].astype(object)).where(found, None)
+    return df
 
-def convert_control_id_to_generic_control_id(control_id, generic_type):
-    if generic_type == 'SETPOINT':
-        return "2"
-    else:
-        if control_id == '1':
-            return "1"
-        else:
-            return "0"
-
-def derive_generic_address_for_poweron_export(row):
-    # Handle ControlId - convert nan/None/empty to empty string
-    if pd.isna(row['ControlId']) or row['ControlId'] == None or row['ControlId'] == '':
-        CtrlText = ''
-    else:
+def convert_control_ids_to_generic_control_ids(control_ids: pd.Series, generic_types: pd.Series) -> np.ndarray:
+    """Setpoints are control "2", control id '1' stays "1" and everything else is "0"."""
+    return np.where(generic_types == 'SETPOINT', '2', np.where(control_ids == '1', '1', '0')).astype(object)
 
-        CtrlText = convert_control_id_to_generic_control_id(row['ControlId'], row['GenericType'])
-
-    if row['Protocol'] == 'IEC60870-101':
-        return pd.Series({
-            'GenericPointAddress': f"[{row['RTUId']}:{row['CASDU']}:{str(row['IOA'])}-{CtrlText} {row['GenericType']}]"
-        })
-    else:
-        return pd.Series({
-            'GenericPointAddress': f"[{row['RTUId']}:{str( 0xFF & int(row['Card'])) }:{(str(row['Offset']))}-{CtrlText} {row['GenericType']}]"
-        })
+def add_poweron_generic_address(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add the GenericPointAddress column to the PowerOn export.
+    iec101 format: [(RTUId):CASDU:IOA-CtrlText GenericType]
+    mk2a format: [(RTUId):card:offset-CtrlText GenericType] - the card is masked to its bottom byte
+    """
+    # Handle ControlId - nan/None/empty give an empty CtrlText
+    control_id = df['ControlId'].astype(object)
+    has_control_id = control_id.notna() & (control_id != '')
+    generic_control_id = convert_control_ids_to_generic_control_ids(control_id, df['GenericType'])
+    ctrl_text = pd.Series(np.where(has_control_id, generic_control_id, ''), index=df.index, dtype=object)
+
+    rtu_id = df['RTUId'].astype(str)
+    generic_type = df['GenericType'].astype(str)
+    is_iec = df['Protocol'] == 'IEC60870-101'
+
+    addresses = pd.Series(None, index=df.index, dtype=object)
+    if is_iec.any():
+        iec = df.loc[is_iec, ['CASDU', 'IOA']].astype(str)
+        addresses[is_iec] = build_generic_point_address(rtu_id[is_iec], iec['CASDU'], iec['IOA'], ctrl_text[is_iec], generic_type[is_iec])
+    if (~is_iec).any():
+        card = convert_to_int_or_none(df.loc[~is_iec, 'Card'])
+        if card.isna().any():
+            raise ValueError(f"Card is not an integer: {df.loc[card[card.isna()].index, 'Card'].unique().tolist()}")
+        card_text = pd.Series(np.bitwise_and(card.to_numpy(dtype='int64'), 0xFF), index=card.index).astype(str)
+        addresses[~is_iec] = build_generic_point_address(rtu_id[~is_iec], card_text, df.loc[~is_iec, 'Offset'].astype(str), ctrl_text[~is_iec], generic_type[~is_iec])
+
+    df['GenericPointAddress'] = addresses
+    return df
     
-def split_ioa(row):
+def convert_to_int_or_none(values: pd.Series) -> pd.Series:
+    """Convert each value with int(), using None where it cannot be converted. Only the distinct values are converted."""
+    codes, uniques = pd.factorize(values)
+    converted = []
+    for value in uniques:
+        try:
+            converted.append(int(value))
+        except:
+            converted.append(None)
+    # factorize codes missing values as -1, which picks up the trailing None
+    converted.append(None)
+    return pd.Series(np.array(converted, dtype=object)[codes], index=values.index, dtype=object)
+
+def split_ioa_column(df: pd.DataFrame):
     """
-    Split the IOA address (int) into IOA1 and IOA2 (bottom 2 bytes).
+    Split the IOA address (int) into IOA1 and IOA2 (bottom 2 bytes) for a whole dataframe.
     
     Required input columns:
     - IOA: int - IOA address
+    - RTU, Card, Word: used for error messages
     
     Returns:
-    - tuple: IOA1 and IOA2
+    - tuple: IOA1 and IOA2 Series (Int64, <NA> where the IOA is blank or not an integer)
     """
-    # check IOA column exists and can be converted to int
-    try:
-        if row['IOA'] is None:
-            return None, None
-        if row['IOA'] == '':
-            return None, None
-        
-        IOA_int = int(row['IOA'])
-    except:
-        print (f" :heavy_exclamation_mark: Error: IOA is not an integer: r{row['RTU']}:c{row['Card']}:w{row['Word']}")
-        return None, None
-    
-    return IOA_int >> 16, IOA_int & 0xFFFF
+    ioa = convert_to_int_or_none(df['IOA'])
+    blank = (df['IOA'] == '') | np.equal(df['IOA'].to_numpy(dtype=object), None)
+    bad = ioa.isna() & ~blank
+    if bad.any():
+        bad_addresses = [f"r{row['RTU']}:c{row['Card']}:w{row['Word']}" for row in df.loc[bad, ['RTU', 'Card', 'Word']].to_dict('records')]
+        print (f" :heavy_exclamation_mark: Error: IOA is not an integer for {len(bad_addresses)} rows: {', '.join(bad_addresses)}")
+
+    ioa = ioa.astype('Int64')
+    return ioa // 65536, ioa % 65536
 
 def combine_ioa(ioa1, ioa2):
     """
     Combine the IOA1 and IOA2 into a single IOA value.
+    Works on single ints, or on whole integer arrays/Series where it returns an int64 array.
     """
-    return (ioa1 << 16) | ioa2
-
-def compute_offset(row):
+    if np.isscalar(ioa1) and np.isscalar(ioa2):
+        return (ioa1 << 16) | ioa2
+    # or IOA2 into the shifted IOA1 in place, so whole arrays only allocate the one output array
+    ioa = np.left_shift(np.asarray(ioa1, dtype='int64'), 16)
+    np.bitwise_or(ioa, np.asarray(ioa2, dtype='int64'), out=ioa)
+    return ioa
+
+def compute_offset_column(df: pd.DataFrame) -> pd.Series:
     """
-    Compute the offset value for a row based on protocol and record type.
+    Compute the offset values for a dataframe based on protocol and record type.
     
     Required input columns:
     - Protocol: str - Protocol type (e.g. 'IEC60870-101')
     - Word: str - Mk2a Word or IEC IOA address 
-    - recordType: str - Type of record ('SD', 'DD', 'A', 'A2')
-    - rtu: str - RTU identifier (used for error messages)
-    - card: str - Card identifier (used for error messages) 
-    - size: str - Size value (used for error messages)
+    - Shift: str - Bit shift within the word
+    - POType: str - Type of record ('DI', 'DD', 'A1', 'A2')
+    - PO_RTU, Card, Size: str - used for error messages
     
     Returns:
-    - int/float: Computed offset value
-    - None: If there are any conversion errors or invalid record types
+    - pd.Series: Computed offset values as strings, None where the word or shift is not an integer
     """
-    # for IEC rtu's just put the IOA into the offset column
-    if row['Protocol'] == 'IEC60870-101':
-        return str(int(row['Word']))
-    
-    try:
-        word = int(row['Word'])
-    except:
-        print (f" :heavy_exclamation_mark: Error: word is not an integer: r{row['PO_RTU']}:c{row['Card']}:w{row['Word']}:b{row['Shift']}:s{row['Size']}")
-        return None
-
-    try:
-        shift = int(row['Shift'])
-    except:
-        print (f" :heavy_exclamation_mark: Error: shift is not an integer: r{row['PO_RTU']}:c{row['Card']}:w{row['Word']}:b{row['Shift']}:s{row['Size']}")
-        return None
-
-    # convert the word to an int and add 1 to account for the fact that the word is 1 based in eTerra
-    word_int = int(word)
-    offset = 0
-
-    if row['POType'] == 'DI':
-        offset = str(int((word_int * 8) + shift))
-    elif row['POType'] == 'DD':
-        offset = str(int(((word_int * 8) + shift) / 2))
-    elif row['POType'] == 'A1':
-        offset = str(int(word_int))
-    elif row['POType'] == 'A2':
-        offset = str(int(word_int))
-    else:
-        offset = str(int(word_int))
-    
-    # convert to int and add 1 to account for the fact that the word is 1 based in eTerra
-    return str(int(offset) + 1)
-    
-
-
-
-
-
-
-
-
+    is_iec = (df['Protocol'] == 'IEC60870-101').to_numpy()
+    word = convert_to_int_or_none(df['Word'])
+    shift = convert_to_int_or_none(df['Shift'])
+    bad = (word.isna() | (shift.isna() & ~is_iec)).to_numpy()
+    if bad.any():
+        bad_addresses = [f"r{row['PO_RTU']}:c{row['Card']}:w{row['Word']}:b{row['Shift']}:s{row['Size']}"
+                         for row in df.loc[bad, ['PO_RTU', 'Card', 'Word', 'Shift', 'Size']].to_dict('records')]
+        print (f" :heavy_exclamation_mark: Error: word or shift is not an integer for {len(bad_addresses)} rows: {', '.join(bad_addresses)}")
+
+    word = word.fillna(0).to_numpy(dtype='int64')
+    shift = shift.fillna(0).to_numpy(dtype='int64')
+    bits = (word * 8) + shift
+    po_type = df['POType'].to_numpy(dtype=object)
+
+    # convert to int and add 1 to account for the fact that the word is 1 based in eTerra - for IEC rtu's just use the IOA
+    offset = np.select([po_type == 'DI', po_type == 'DD'], [bits, np.trunc(bits / 2).astype('int64')], default=word) + 1
+    offset = np.where(is_iec, word, offset).astype(str).astype(object)
+    offset[bad] = None
+    return pd.Series(offset, index=df.index, dtype=object)
 
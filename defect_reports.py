@@ -419,7 +419,14 @@ def generate_defect_report(df: pd.DataFrame, report_name: str, report_config: di
     """
     # Start with a copy of the input DataFrame to avoid modifying the original
     result = df.copy()
-    
+    result[report_name] = evaluate_defect_report(df, report_name, report_config, debug)
+    return result
+
+def evaluate_defect_report(df: pd.DataFrame, report_name: str, report_config: dict, debug: bool = False) -> pd.Series:
+    """
+    Evaluate the criteria from config against df without copying it.
+    Returns a boolean Series (aligned to df) that is True for rows matching the report.
+    """
     # For AND operations, we start with True and filter down
     # For OR operations, we start with False and build up
     # This is because:
@@ -432,21 +439,21 @@ def generate_defect_report(df: pd.DataFrame, report_name: str, report_config: di
         print(f"\nDebugging {report_name}...")
         print(f"Initial value: {initial_value}")
         print(f"Report config: {report_config}")
-        print(f"Starting row count: {result.shape[0]} rows")
+        print(f"Starting row count: {df.shape[0]} rows")
         print("\n================================================")
         print(f"{report_name}: Initial result {initial_value}")
         print("================================================\n")
     
     if 'criteria_groups' in report_config:
         # Initialize report column
-        result[report_name] = initial_value
+        report_result = pd.Series(initial_value, index=df.index)
 
         for group_idx, group in enumerate(report_config['criteria_groups']):
             if debug:
                 print(f"\nGroup {group_idx + 1} (combine with {group.get('combine_with', 'and')})")
                 
             # Same logic for group initialization
-            group_result = pd.Series(True if group.get('combine_with') == 'and' else False, index=result.index)
+            group_result = pd.Series(True if group.get('combine_with') == 'and' else False, index=df.index)
             
             if 'criteria_groups' in group:
                 # Handle nested groups
@@ -454,7 +461,7 @@ def generate_defect_report(df: pd.DataFrame, report_name: str, report_config: di
                     if debug:
                         print(f"  Subgroup {subgroup_idx + 1} (combine with {subgroup.get('combine_with', 'and')})")
                         
-                    subgroup_result = pd.Series(True if subgroup.get('combine_with') == 'and' else False, index=result.index)
+                    subgroup_result = pd.Series(True if subgroup.get('combine_with') == 'and' else False, index=df.index)
                     
                     for criteria_idx, criteria in enumerate(subgroup['criteria']):
                         if len(criteria) == 2:
@@ -466,7 +473,7 @@ def generate_defect_report(df: pd.DataFrame, report_name: str, report_config: di
                         if debug:
                             print(f"    Criteria {criteria_idx + 1}: {cols} {op} {val}")
                             
-                        criteria_result = evaluate_criteria(result, cols, op, val)
+                        criteria_result = evaluate_criteria(df, cols, op, val)
                         prev_count = subgroup_result.sum()
                         
                         if subgroup.get('combine_with') == 'or':
@@ -499,7 +506,7 @@ def generate_defect_report(df: pd.DataFrame, report_name: str, report_config: di
                     if debug:
                         print(f"  Criteria {criteria_idx + 1}: {cols} {op} {val}")
                         
-                    criteria_result = evaluate_criteria(result, cols, op, val)
+                    criteria_result = evaluate_criteria(df, cols, op, val)
                     prev_count = group_result.sum()
                     
                     if group.get('combine_with') == 'or':
@@ -511,19 +518,21 @@ def generate_defect_report(df: pd.DataFrame, report_name: str, report_config: di
                         print(f"    Rows matching: {criteria_result.sum()}")
                         print(f"    After combining: {group_result.sum()} ({prev_count} -> {group_result.sum()})")
             
-            prev_count = result[report_name].sum()
+            prev_count = report_result.sum()
             if report_config.get('combine_groups_with') == 'or':
-                result[report_name] |= group_result
+                report_result |= group_result
             else:  # default to 'and'
-                result[report_name] &= group_result
+                report_result &= group_result
                 
             if debug:
                 print(f"  Group result: {group_result.sum()} rows")
-                print(f"  After combining with final result: {result[report_name].sum()} ({prev_count} -> {result[report_name].sum()})")
+                print(f"  After combining with final result: {report_result.sum()} ({prev_count} -> {report_result.sum()})")
     else:
         # Initialize report column if it doesn't exist
-        if report_name not in result.columns:
-            result[report_name] = initial_value
+        if report_name not in df.columns:
+            report_result = pd.Series(initial_value, index=df.index)
+        else:
+            report_result = df[report_name].copy()
 
         for criteria_idx, criteria in enumerate(report_config['criteria']):
             if len(criteria) == 2:
@@ -535,23 +544,23 @@ def generate_defect_report(df: pd.DataFrame, report_name: str, report_config: di
             if debug:
                 print(f"\nCriteria {criteria_idx + 1}: {cols} {op} {val}")
                 
-            criteria_result = evaluate_criteria(result, cols, op, val)
-            prev_count = result[report_name].sum()
+            criteria_result = evaluate_criteria(df, cols, op, val)
+            prev_count = report_result.sum()
             
             if report_config.get('combine_with') == 'or':
-                result[report_name] = result[report_name] | criteria_result
+                report_result = report_result | criteria_result
             else:  # default to 'and'
-                result[report_name] = result[report_name] & criteria_result
+                report_result = report_result & criteria_result
             if debug:
                 print(f"  Rows matching: {criteria_result.sum()}")
-                print(f"  After combining: {result[report_name].sum()} ({prev_count} -> {result[report_name].sum()})")
+                print(f"  After combining: {report_result.sum()} ({prev_count} -> {report_result.sum()})")
 
     if debug:
-        if len(result[result[report_name] == True]) == 0:
+        if report_result.sum() == 0:
             print("\nNo rows left after applying all criteria")
-        print(f"\nFinal result: {result[report_name].sum()} rows")
+        print(f"\nFinal result: {report_result.sum()} rows")
 
-    return result
+    return report_result
 
 def evaluate_criteria(df: pd.DataFrame, cols: str, op: str, val: any) -> pd.Series:
     """Evaluate a single criteria and return the result"""
@@ -655,4 +664,34 @@ def generate_defect_report_by_name(df: pd.DataFrame, report_name: str, debug: bo
     print(f" :chart_increasing: Generating report: {report_name} ... ", end='')
     updated_df = generate_defect_report(df, report_name, REPORT_CONFIGS[report_name], debug)
     print(f"{updated_df[updated_df[report_name] == True].shape[0]} matching rows. ({REPORT_CONFIGS[report_name]['name']})")
-    return updated_df
\ No newline at end of file
+    return updated_df
+
+def get_report_criteria_columns(report_config: dict) -> set:
+    """Return the set of column names referenced by a report config (including nested groups)"""
+    columns = set()
+    for criteria in report_config.get('criteria', []):
+        for col_group in criteria[0].split('|'):
+            columns.update(col_group.split(','))
+    for group in report_config.get('criteria_groups', []):
+        columns |= get_report_criteria_columns(group)
+    return columns
+
+def generate_all_defect_reports(df: pd.DataFrame, report_names: list, debug: bool = False) -> pd.DataFrame:
+    """Generate several defect reports in one pass, adding all the report columns to a single copy of df"""
+    flags = {}
+    for report_name in report_names:
+        if report_name not in REPORT_CONFIGS:
+            raise ValueError(f"Unknown report name: {report_name}")
+        report_config = REPORT_CONFIGS[report_name]
+        print(f" :chart_increasing: Generating report: {report_name} ... ", end='')
+
+        # Reports like ReportANY are built from earlier report columns, so give them a narrow frame holding just the columns they use
+        source_df = df
+        criteria_columns = get_report_criteria_columns(report_config)
+        if not criteria_columns.isdisjoint(flags):
+            source_df = pd.DataFrame({col: flags[col] if col in flags else df[col] for col in criteria_columns}, index=df.index)
+
+        flags[report_name] = evaluate_defect_report(source_df, report_name, report_config, debug)
+        print(f"{int(flags[report_name].sum())} matching rows. ({report_config['name']})")
+
+    return df.assign(**flags)
@@ -1,9 +1,15 @@
+import numbers
+import zipfile
+import numpy as np
 import pandas as pd
+from copy import copy
 from pathlib import Path
+from xml.sax.saxutils import escape as xml_escape
 from rich import print
 
 import openpyxl
 from openpyxl.utils import get_column_letter
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
 import openpyxl.styles
 from openpyxl.formatting.rule import CellIsRule, FormulaRule
 from openpyxl.styles import Border, Side, PatternFill, Font, NamedStyle, GradientFill, Alignment
@@ -391,80 +397,181 @@ def apply_conditional_formatting(ws, report_columns, start_row=2, debug=False):
 
 def create_points_section(df: pd.DataFrame) -> pd.DataFrame:
     """Create the points section of the report."""
-    points = []
-    
-    for _, row in df.iterrows():
-        
-        if row.get('GenericType') in ['SD', 'DD']:
-            point = {
-                'Type': row.get('GenericType', ''),
-                'SCADA Address': row.get('GenericPointAddress', ''),
-                'eTerra Key': row.get('eTerraKey', ''),
-                'PowerOn Alias': row.get('POAlias', ''),
-                'ICCP Flag': row.get('ICCPFlag', ''),
-                'Habdde Match Status': row.get('HbddeCompareStatus', ''),
-                'PowerOn Config Health Status': row.get('ConfigHealth', ''),
-                'Control Zone Status': row.get('CompAlarmAlarmZoneMatch', ''),
-            }
-            # Get the Ctrl Info
-            if row.get('Controllable') == '1':
-                if row.get('Ctrl1Addr','') != '':
-                    point['Ctrl1Addr'] = row.get('Ctrl1Addr','')
-                    point['Ctrl1Name'] = row.get('Ctrl1Name','')
-                if row.get('Ctrl2Addr','') != '':
-                    point['Ctrl2Addr'] = row.get('Ctrl2Addr','')
-                    point['Ctrl2Name'] = row.get('Ctrl2Name','')
-            else:
-                point['Ctrl1Addr'] = ''
-                point['Ctrl1Name'] = ''
-                point['Ctrl2Addr'] = ''
-                point['Ctrl2Name'] = ''
-
-            # Get the Alarm Info
-            if row.get('CompAlarmEterraAlias','') != '':
-                point['CompAlarmeTerraAlarmZone'] = row.get('CompAlarmeTerraAlarmZone','')
-                point['CompAlarmeTerraStatus'] = row.get('CompAlarmeTerraStatus','')
-                point['CompAlarmPOsubstation'] = row.get('CompAlarmPOsubstation','')
-                point['CompAlarmPOAlarmZone'] = row.get('CompAlarmPOAlarmZone','')
-                point['CompAlarmPOAlarmRef'] = row.get('CompAlarmPOAlarmRef','')
-                point['CompAlarmPOStatus'] = row.get('CompAlarmPOStatus','')
-                point['CompAlarmAlarmZoneMatch'] = row.get('CompAlarmAlarmZoneMatch','')
-                point['Alarm0_MessageMatch'] = row.get('Alarm0_MessageMatch','')
-                point['Alarm1_MessageMatch'] = row.get('Alarm1_MessageMatch','')
-                point['Alarm2_MessageMatch'] = row.get('Alarm2_MessageMatch','')
-                point['Alarm3_MessageMatch'] = row.get('Alarm3_MessageMatch','')
-
-            # Add the Report flags
-            point['Report1'] = row.get('Report1', '')
-            point['Report2'] = row.get('Report2', '')
-            point['Report3'] = row.get('Report3', '')
-
-
-            points.append(point)
+    df = df[df['GenericType'].isin(['SD', 'DD'])] if 'GenericType' in df.columns else df.iloc[0:0]
+    if df.empty:
+        return pd.DataFrame()
+
+    # Collect every output column as a numpy array and build the dataframe once at the end
+    def col(name):
+        return df[name].to_numpy() if name in df.columns else np.full(len(df), '', dtype=object)
+
+    points = {
+        'Type': col('GenericType'),
+        'SCADA Address': col('GenericPointAddress'),
+        'eTerra Key': col('eTerraKey'),
+        'PowerOn Alias': col('POAlias'),
+        'ICCP Flag': col('ICCPFlag'),
+        'Habdde Match Status': col('HbddeCompareStatus'),
+        'PowerOn Config Health Status': col('ConfigHealth'),
+        'Control Zone Status': col('CompAlarmAlarmZoneMatch'),
+    }
+
+    # Get the Ctrl Info - blank for non controllable points, left empty where a controllable point has no address
+    controllable = col('Controllable') == '1'
+    for ctrl in ['Ctrl1', 'Ctrl2']:
+        has_ctrl = controllable & (col(f'{ctrl}Addr') != '')
+        if not (has_ctrl.any() or (~controllable).any()):
+            continue
+        for field in ['Addr', 'Name']:
+            values = np.full(len(df), '', dtype=object)
+            values[controllable] = np.nan
+            values[has_ctrl] = col(f'{ctrl}{field}')[has_ctrl]
+            points[f'{ctrl}{field}'] = values
+
+    # Get the Alarm Info
+    has_alarm = col('CompAlarmEterraAlias') != ''
+    if has_alarm.any():
+        for name in ['CompAlarmeTerraAlarmZone', 'CompAlarmeTerraStatus', 'CompAlarmPOsubstation', 'CompAlarmPOAlarmZone',
+                     'CompAlarmPOAlarmRef', 'CompAlarmPOStatus', 'CompAlarmAlarmZoneMatch',
+                     'Alarm0_MessageMatch', 'Alarm1_MessageMatch', 'Alarm2_MessageMatch', 'Alarm3_MessageMatch']:
+            values = np.full(len(df), np.nan, dtype=object)
+            values[has_alarm] = col(name)[has_alarm]
+            points[name] = values
+
+    # Add the Report flags
+    for name in ['Report1', 'Report2', 'Report3']:
+        points[name] = col(name)
 
     return pd.DataFrame(points)
 
 
+def get_column_widths(df: pd.DataFrame) -> np.ndarray:
+    """Get the excel column widths for a dataframe - the longest of the header and the values in each column, plus padding."""
+    header_lengths = np.array([len(str(col)) for col in df.columns], dtype=int)
+    if len(df) == 0:
+        return header_lengths + 2
+    value_lengths = df.astype(str).where(df.notna(), '').apply(lambda s: s.str.len().max()).fillna(0).astype(int).to_numpy()
+    return np.maximum(header_lengths, value_lengths) + 2
+
+
 def save_reports(reports: list, output_path: Path):
     """Save the report to an Excel file."""
-    with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-        for report in reports:
+    # Stream the rows with a write only workbook - the column widths are worked out from the dataframe first
+    # as write only worksheets need their column widths set before any rows are added
+    workbook = openpyxl.Workbook(write_only=True)
+    for report in reports:
+        df = report['Content']
+        worksheet = workbook.create_sheet(title=report['RTU'])
+        values = df.astype(object).where(df.notna(), None)
+
+        for idx, width in enumerate(get_column_widths(df), 1):
+            worksheet.column_dimensions[get_column_letter(idx)].width = int(width)
+
+        worksheet.append([str(col) for col in df.columns])
+        for row in values.itertuples(index=False, name=None):
+            worksheet.append(row)
+
+    workbook.save(output_path)
+
+
+XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '{sheets}'
+    '</Types>'
+)
+XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets>{sheets}</sheets>'
+    '</workbook>'
+)
+XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rIdStyles" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    '{sheets}'
+    '</Relationships>'
+)
+# The minimal default styles Excel expects, the fast writer does not format any cells
+XLSX_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+
+def xlsx_cell_xml(ref: str, value) -> str:
+    """Get the SheetML for a single value cell - an empty string for missing values."""
+    if value is None or (isinstance(value, float) and value != value) or value is pd.NA or value is pd.NaT:
+        return ''
+    if isinstance(value, (bool, np.bool_)):
+        return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, numbers.Number) and np.isfinite(value):
+        return f'<c r="{ref}"><v>{value}</v></c>'
+    text = xml_escape(ILLEGAL_CHARACTERS_RE.sub('', str(value)))
+    return f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def save_reports_fast(reports: list, output_path: Path):
+    """Save value only reports (no styles or formulas) to an Excel file by writing the SheetML directly.
+    Use save_reports for anything that needs openpyxl."""
+    with zipfile.ZipFile(output_path, 'w', compression=zipfile.ZIP_DEFLATED) as xlsx:
+        for sheet_num, report in enumerate(reports, 1):
             df = report['Content']
-            df.to_excel(writer, sheet_name=report['RTU'], index=False)
-        
-        # Apply formatting
-        worksheet = writer.sheets[report['RTU']]
-        for column in worksheet.columns:
-            max_length = 0
-            column = [cell for cell in column]
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = (max_length + 2)
-            worksheet.column_dimensions[column[0].column_letter].width = adjusted_width 
+            column_letters = [get_column_letter(idx) for idx in range(1, len(df.columns) + 1)]
+            widths = get_column_widths(df)
+
+            with xlsx.open(f'xl/worksheets/sheet{sheet_num}.xml', 'w') as sheet:
+                parts = ['<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                         '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">']
+                if len(widths) > 0:
+                    parts.append('<cols>')
+                    parts.extend(f'<col min="{idx}" max="{idx}" width="{int(width)}" customWidth="1"/>' for idx, width in enumerate(widths, 1))
+                    parts.append('</cols>')
+                parts.append('<sheetData>')
+                parts.append('<row r="1">' + ''.join(xlsx_cell_xml(f'{letter}1', str(col)) for letter, col in zip(column_letters, df.columns)) + '</row>')
+                sheet.write(''.join(parts).encode('utf-8'))
+
+                # Stream the rows in blocks so large sheets are never held as one string
+                rows = []
+                for row_num, row in enumerate(df.itertuples(index=False, name=None), 2):
+                    rows.append(f'<row r="{row_num}">' + ''.join(xlsx_cell_xml(f'{letter}{row_num}', value) for letter, value in zip(column_letters, row)) + '</row>')
+                    if len(rows) >= 1000:
+                        sheet.write(''.join(rows).encode('utf-8'))
+                        rows = []
+                rows.append('</sheetData></worksheet>')
+                sheet.write(''.join(rows).encode('utf-8'))
+
+        sheet_nums = range(1, len(reports) + 1)
+        xlsx.writestr('[Content_Types].xml', XLSX_CONTENT_TYPES.format(sheets=''.join(
+            f'<Override PartName="/xl/worksheets/sheet{num}.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            for num in sheet_nums)))
+        xlsx.writestr('_rels/.rels', XLSX_ROOT_RELS)
+        xlsx.writestr('xl/styles.xml', XLSX_STYLES)
+        xlsx.writestr('xl/workbook.xml', XLSX_WORKBOOK.format(sheets=''.join(
+            f'<sheet name="{xml_escape(str(report["RTU"]), {chr(34): "&quot;"})}" sheetId="{num}" r:id="rId{num}"/>'
+            for num, report in zip(sheet_nums, reports))))
+        xlsx.writestr('xl/_rels/workbook.xml.rels', XLSX_WORKBOOK_RELS.format(sheets=''.join(
+            f'<Relationship Id="rId{num}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet{num}.xml"/>'
+            for num in sheet_nums)))
 
 
 def generate_report_in_excel(df: pd.DataFrame, report_definition: dict, output_path: Path):
@@ -519,40 +626,64 @@ def generate_report_in_excel(df: pd.DataFrame, report_definition: dict, output_p
     # Freeze top row
     worksheet.freeze_panes = worksheet['F2']
 
+    # All data cells share the same thin black border, so build it once
+    thin_side = openpyxl.styles.Side(style='thin', color='000000')
+    thin_border = openpyxl.styles.Border(left=thin_side, right=thin_side, top=thin_side, bottom=thin_side)
+    last_row = len(report_df) + 1
+
     for idx, col in enumerate(report_columns, 1):
+        column_letter = get_column_letter(idx)
 
         # Rename report columns to be more readable going from dfCol to ColName 
         if col['dfCol'] != col['ColName']:
-            worksheet[f"{get_column_letter(idx)}1"].value = col['ColName']
+            worksheet[f"{column_letter}1"].value = col['ColName']
 
         # Setup column widths
-        worksheet.column_dimensions[get_column_letter(idx)].width = col['ColWidth']
+        worksheet.column_dimensions[column_letter].width = col['ColWidth']
 
         # apply the alignment
-        for row in range(1, len(report_df) + 2):
-            worksheet[f"{get_column_letter(idx)}{row}"].alignment = openpyxl.styles.Alignment(horizontal=col['Align'])
+        alignment = openpyxl.styles.Alignment(horizontal=col['Align'])
+        for row in range(1, last_row + 1):
+            worksheet.cell(row=row, column=idx).alignment = alignment
+
+        if last_row < 2:
+            continue
+
+        # Work out the fill and font for the column once, on the first data cell, then share them down the column
+        first_cell = worksheet.cell(row=2, column=idx)
+        has_fill = False
+        has_font = False
+        if 'ColFill' in col and col['ColFill'] and pd.notna(col['ColFill']):
+            if isinstance(col['ColFill'], str):
+                first_cell.fill = openpyxl.styles.PatternFill(start_color=col['ColFill'], end_color=col['ColFill'], fill_type='solid')
+                has_fill = True
+        if 'FontStyle' in col and col['FontStyle'] and pd.notna(col['FontStyle']): # if a formatting style is specified, apply it
+            applyFontStyleToCell(first_cell, col['FontStyle'])
+            has_font = True
+        if 'FontSize' in col and col['FontSize'] and pd.notna(col['FontSize']):
+            applyFontSizeToCell(first_cell, col['FontSize'])
+            has_font = True
+        if 'FontColor' in col and col['FontColor'] and pd.notna(col['FontColor']):
+            applyFontColorToCell(first_cell, col['FontColor'])
+            has_font = True
+        if 'FontName' in col and col['FontName'] and pd.notna(col['FontName']):
+            applyFontNameToCell(first_cell, col['FontName'])
+            has_font = True
+        if 'Style' in col and col['Style'] and pd.notna(col['Style']):
+            applyStyleToCell(first_cell, col['Style'])
+            has_fill = True
+            has_font = True
+        column_fill = copy(first_cell.fill) if has_fill else None
+        column_font = copy(first_cell.font) if has_font else None
 
         # Apply the fill colors and set all borders to be black and 1pt thick
-        for row in range(2, len(report_df) + 2):
-                cell = worksheet[f"{get_column_letter(idx)}{row}"]
-                if 'ColFill' in col and col['ColFill'] and pd.notna(col['ColFill']):
-                    if isinstance(col['ColFill'], str):
-                        cell.fill = openpyxl.styles.PatternFill(start_color=col['ColFill'], end_color=col['ColFill'], fill_type='solid')
-                if 'FontStyle' in col and col['FontStyle'] and pd.notna(col['FontStyle']): # if a formatting style is specified, apply it
-                    applyFontStyleToCell(cell, col['FontStyle'])
-                if 'FontSize' in col and col['FontSize'] and pd.notna(col['FontSize']):
-                    applyFontSizeToCell(cell, col['FontSize'])
-                if 'FontColor' in col and col['FontColor'] and pd.notna(col['FontColor']):
-                    applyFontColorToCell(cell, col['FontColor'])
-                if 'FontName' in col and col['FontName'] and pd.notna(col['FontName']):
-                    applyFontNameToCell(cell, col['FontName'])
-                if 'Style' in col and col['Style'] and pd.notna(col['Style']):
-                    applyStyleToCell(cell, col['Style'])
-
-                cell.border = openpyxl.styles.Border(left=openpyxl.styles.Side(style='thin', color='000000'),
-                                                    right=openpyxl.styles.Side(style='thin', color='000000'),
-                                                    top=openpyxl.styles.Side(style='thin', color='000000'),
-                                                    bottom=openpyxl.styles.Side(style='thin', color='000000'))
+        for row in range(2, last_row + 1):
+            cell = worksheet.cell(row=row, column=idx)
+            if column_fill is not None:
+                cell.fill = column_fill
+            if column_font is not None:
+                cell.font = column_font
+            cell.border = thin_border
 
     apply_conditional_formatting(worksheet, report_columns)
 
@@ -3,6 +3,8 @@
 import os
 import sys
 import warnings
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import numpy as np
 import pandas as pd
 import sqlite3
 from rich import print
@@ -14,6 +16,7 @@ warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
 from pathlib import Path
 from typing import List, Dict, Optional
 from data_import.utils import (
+    build_rtu_index,
     filter_data_by_rtu,
     filter_data_by_substation,
 )
@@ -26,7 +29,7 @@ from data_import.import_habdde import (
     add_control_info_to_eterra_export,
     set_grid_incomer_flag_based_on_eterra_alias
 )
-from data_import.import_poweron_rtu_report import clean_all_rtus
+from data_import.import_poweron_rtu_report import clean_all_rtus, POWERON_COLUMN_RENAMES
 from data_import.import_alarm_compare import clean_compare_alarms
 from data_import.import_controls_auto_test_report import clean_controls_test
 from data_import.import_manual_commissioning_data import clean_manual_commissioning
@@ -34,16 +37,17 @@ from data_import.import_habdde_compare import clean_habdde_compare
 from report_generation import (
     create_style_guide,
     create_points_section,
-    save_reports,
+    save_reports_fast,
     generate_report_in_excel,
     generate_defect_report_in_excel
 )
 from defect_reports import (
-    generate_defect_report_by_name
+    generate_all_defect_reports
 )
 from local_query.po_query import check_if_component_alias_exists_in_poweron, checkIfComponentAliasInScanPointComponents
 import configparser
 
+from openpyxl import load_workbook
 from openpyxl.utils import get_column_letter
 from pylib3i.habdde import remove_dummy_points_from_df, get_dummy_points_from_df, read_habdde_card_tab_into_df
 
@@ -52,6 +56,46 @@ DEFAULT_DATA_DIR = 'rtu_report_data'
 DEFAULT_CONFIG_DIR = 'rtu_report_config'
 DEFAULT_OUTPUT_DIR = 'reports'
 
+# Card number ranges used to classify MK2A cards:
+#   100-118 DIGITAL, 119-135 INTERNAL, 136-169 ANALOG (includes Taps), 170-255 INTERNAL, anything else UNKNOWN
+CARD_TYPE_BOUNDS = np.array([100, 119, 136, 170, 256])
+CARD_TYPE_LABELS = np.array(['UNKNOWN', 'DIGITAL', 'INTERNAL', 'ANALOG', 'INTERNAL', 'UNKNOWN'], dtype=object)
+
+# MK2A cards that are not expected to have PowerOn points
+MK2A_SKIP_CARDS = {'250', '251', '252', '253', '254', '119', ''}
+
+# Low cardinality columns of the merged data that are used for grouping, joining and filtering
+CATEGORICAL_COLUMNS = ['PO_RTU', 'PO_Card', 'ConfigHealth', 'RTU', 'Protocol', 'GenericType', 'DeviceType']
+
+# Most reports rendered at once - each one holds its slice of the merged data in the parent and a worker process
+MAX_REPORT_WORKERS = 4
+
+# Per control result columns, added as Ctrl<n><column> for control 1 and 2
+CONTROL_RESULT_COLUMNS = ['MatchStatus', 'ConfigHealth', 'AutoTestStatus', 'TestResult', 'VisualCheckResult', 'ControlSentResult', 'TelecontrolAction', 'Comments']
+
+def make_parquet_safe(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert columns holding a mix of value types (e.g. 1/0/'') to strings so pyarrow can store them."""
+    mixed_columns = {}
+    for column in df.columns:
+        values = df[column].cat.categories if isinstance(df[column].dtype, pd.CategoricalDtype) else df[column]
+        if values.dtype == object and pd.api.types.infer_dtype(values, skipna=True) in ('mixed', 'mixed-integer'):
+            mixed_columns[column] = df[column].astype(object).where(df[column].isna(), df[column].astype(str))
+    return df.assign(**mixed_columns) if mixed_columns else df
+
+def classify_card_types(cards: pd.Series) -> pd.Series:
+    """Label each card number as DIGITAL/ANALOG/INTERNAL/UNKNOWN in a single vectorised pass."""
+    card_numbers = pd.to_numeric(cards, errors='coerce').to_numpy(dtype='float64')
+    card_types = CARD_TYPE_LABELS[np.searchsorted(CARD_TYPE_BOUNDS, card_numbers, side='right')]
+    # anything that is not a whole card number is UNKNOWN
+    card_types[np.isnan(card_numbers) | (np.mod(card_numbers, 1) != 0)] = 'UNKNOWN'
+    return pd.Series(card_types, index=cards.index)
+
+def lookup_unique_values(values: pd.Series, lookup) -> pd.Series:
+    """Call lookup once per distinct value and spread the results back over every row (missing values use lookup(None))."""
+    codes, uniques = pd.factorize(values)
+    results = np.array([lookup(value) for value in uniques] + [lookup(None)])
+    return pd.Series(results[codes], index=values.index)
+
 def load_config(config_path=CONFIG_FILE):
     config = configparser.ConfigParser()
     config.read(config_path)
@@ -114,7 +158,7 @@ class RTUReportGenerator:
                     if key in config['Files']:
                         self.required_files[key] = config['Files'][key]
 
-        # set the data cache db
+        # set the data cache file
         if write_cache or read_cache:
             # get the data cache directory from the config file
             self.data_cache_dir = Path(self.config['Paths']['data_cache_dir'])
@@ -127,14 +171,15 @@ class RTUReportGenerator:
                 print(f"Error: Data cache directory does not exist: {self.data_cache_dir}")
                 sys.exit(1)
 
-            self.data_cache_db = self.data_cache_dir / 'data_cache.db'
+            # the cache file name can be set in the Files section of the config file
+            self.data_cache_file = self.data_cache_dir / self.config.get('Files', 'data_cache_file', fallback='merged_data.parquet')
         else:
-            self.data_cache_db = None
+            self.data_cache_file = None
             write_cache = False
             read_cache = False
 
         print(f"write_cache: {write_cache} read_cache: {read_cache}")
-        print(f"data_cache_db: {self.data_cache_db}")
+        print(f"data_cache_file: {self.data_cache_file}")
 
         if 'Databases' in self.config:
             if 'poweron_db' in self.config['Databases']:
@@ -187,25 +232,21 @@ class RTUReportGenerator:
     
     ''' ********** write_data_cache ********** '''
     def write_data_cache(self):
-        """Write the data cache to the database."""
-        # write the merged data to the database
+        """Write the data cache to a parquet file."""
+        # write the merged data to the parquet file
         if self.merged_data is None:
             print("No merged data to write to cache")
             return
-        print(f"Writing data cache to {self.data_cache_db}")
+        print(f"Writing data cache to {self.data_cache_file}")
 
-        conn = sqlite3.connect(self.data_cache_db)
-        self.merged_data.to_sql('merged_data', conn, if_exists='replace', index=False)
-        conn.close()
+        make_parquet_safe(self.merged_data).to_parquet(self.data_cache_file, engine='pyarrow', compression='zstd', index=False)
 
     ''' ********** read_data_cache ********** '''
     def read_data_cache(self, rtu_name: Optional[str] = None, substation: Optional[str] = None):
-        """Read the data cache from the database."""
-        # read the merged data from the database
-        print(f" :mag_right: Reading data cache from {self.data_cache_db}")
-        conn = sqlite3.connect(self.data_cache_db)
-        self.merged_data = pd.read_sql_query('SELECT * FROM merged_data', conn)
-        conn.close()
+        """Read the data cache from the parquet file."""
+        # read the merged data from the parquet file
+        print(f" :mag_right: Reading data cache from {self.data_cache_file}")
+        self.merged_data = pd.read_parquet(self.data_cache_file, engine='pyarrow')
         print(f"Read {self.merged_data.shape[0]} rows from data cache")
 
         # if the merged data is empty, return
@@ -222,6 +263,8 @@ class RTUReportGenerator:
             self.merged_data[column] = self.merged_data[column].replace('', False)
             self.merged_data[column] = self.merged_data[column].astype(bool)
 
+        self.merged_data = self.convert_columns_to_categorical(self.merged_data)
+
         # int_columns = ['Controllable','Alarm0', 'Alarm1', 'Alarm2', 'Alarm3', 'Ctrl1', 'Ctrl1V', 'Ctrl1C', 'Ctrl2', 'Ctrl2V', 'Ctrl2C']
         # for column in int_columns:
         #     # Fill NA/empty values with 0 before converting to int
@@ -281,11 +324,13 @@ class RTUReportGenerator:
         # make a copy of no_input_controls so we can create a vesion without eTerraAlias duplicates
         no_input_controls_deduped = no_input_controls.drop_duplicates(subset=['eTerraAlias'])
         # in the no_input_dummy_points dataframe, set the RTU to the RTU value from the corresponding row in no_input_controls_deduped
-        no_input_dummy_points.loc[:,'RTU'] = no_input_dummy_points['eTerraAlias'].map(no_input_controls_deduped.set_index('eTerraAlias')['RTU'])
+        # (assign whole columns on a copy - RTU is categorical so it cannot be set in place with RTU names from another frame)
+        no_input_dummy_points = no_input_dummy_points.copy()
+        no_input_dummy_points['RTU'] = no_input_dummy_points['eTerraAlias'].map(no_input_controls_deduped.set_index('eTerraAlias')['RTU'].astype(object))
         # set the PowerOn Alias to the eTerraAlias
-        no_input_dummy_points.loc[:,'PowerOn Alias'] = no_input_dummy_points['eTerraAlias']
+        no_input_dummy_points['PowerOn Alias'] = no_input_dummy_points['eTerraAlias']
         # get the PowerOn Alias Exists by querying
-        no_input_dummy_points.loc[:,'PowerOn Alias Exists'] = no_input_dummy_points['PowerOn Alias'].apply(check_if_component_alias_exists_in_poweron, poweron_db=self.poweron_db)
+        no_input_dummy_points['PowerOn Alias Exists'] = no_input_dummy_points['PowerOn Alias'].apply(check_if_component_alias_exists_in_poweron, poweron_db=self.poweron_db)
         
 
         # Add the no_input_dummy_points to the self.eterra_point_export dataframe
@@ -399,7 +444,8 @@ class RTUReportGenerator:
     ''' ********** load_poweron_data ********** '''
     def load_poweron_data(self):
         print(f" :arrow_forward: Loading poweron data from {self.data_dir / self.required_files['all_rtus']}")
-        self.all_rtus = pd.read_csv(self.data_dir / self.required_files['all_rtus'], low_memory=False)
+        # only parse the columns clean_all_rtus uses
+        self.all_rtus = pd.read_csv(self.data_dir / self.required_files['all_rtus'], usecols=list(POWERON_COLUMN_RENAMES), low_memory=False)
         self.all_rtus = clean_all_rtus(self.all_rtus)
         if self.debug_dir:
             self.all_rtus.to_csv(f"{self.debug_dir}/all_rtus.csv", index=False)
@@ -490,6 +536,7 @@ class RTUReportGenerator:
         #merged = self.merge_alarm_token_analysis_dl12(merged) # add cols: T3 Analysis, T5 Analysis
         #merged = self.add_check_alarms_spreadsheet_with_po(merged) # adds cols: Alias, Location, LocationFull
         merged = self.add_derived_columns(merged)
+        merged = self.convert_columns_to_categorical(merged)
         merged = self.add_issue_report_flags(merged)
 
         if self.debug_dir:
@@ -498,6 +545,14 @@ class RTUReportGenerator:
         
         return merged
     
+    ''' ********** convert_columns_to_categorical ********** '''
+    def convert_columns_to_categorical(self, merged: pd.DataFrame) -> pd.DataFrame:
+        """Store the low cardinality key columns as categoricals so grouping and joining work on integer codes."""
+        for column in CATEGORICAL_COLUMNS:
+            if column in merged.columns:
+                merged[column] = merged[column].astype('category')
+        return merged
+
     #####################################################################
     #                                                                    
     #                      Add Derived Columns                           
@@ -511,13 +566,13 @@ class RTUReportGenerator:
         print(f" ✅ Adding derived columns to merged data...")
         # first get a Type column that also flags the dummy rows are DUMMY, Get the value of GenericType unless the RTUId = '(€€€€€€€€:)'
         print(f"  🧠 Adding Type column...")
-        merged['Type'] = merged.apply(lambda row: 'DUMMY' if row['RTUId'] == '(€€€€€€€€:)' else row['GenericType'], axis=1)
+        merged['Type'] = merged['GenericType'].where(merged['RTUId'] != '(€€€€€€€€:)', 'DUMMY')
         # now make an ignore column that is TRUE if any of IGNORE_RTU, IGNORE_POINT, OLD_DATA are TRUE
         print(f"  🧠 Adding Ignore column...")
-        merged['Ignore'] = merged.apply(lambda row: True if (row['IGNORE_RTU'] == True or row['IGNORE_POINT'] == True or row['OLD_DATA'] == True ) else False, axis=1)
+        merged['Ignore'] = (merged['IGNORE_RTU'] == True) | (merged['IGNORE_POINT'] == True) | (merged['OLD_DATA'] == True)
         # We want to add a new column 'RTUComms' to the df that is True if the DeviceType is 'RTU and the eTerraAlias does not contain 'LDC'
         print(f"  🧠 Adding RTUComms column...")
-        merged['RTUComms'] = merged.apply(lambda row: True if row['DeviceType'] == 'RTU' and 'LDC' not in row['eTerraAlias'] else False, axis=1)
+        merged['RTUComms'] = (merged['DeviceType'] == 'RTU') & ~merged['eTerraAlias'].str.contains('LDC', regex=False, na=False)
 
         
         # Create 2 new columsn eTerraAliasExistsInPO, eTerraAliasLinkedToSCADA
@@ -537,25 +592,26 @@ class RTUReportGenerator:
         
         # 1. get_poweron_alias_exists(eTerraAlias) - returns 1/0 if the eTerraAlias exists in PowerOn
         # 2. get_poweron_alias_linked_to_scada(eTerraAlias) - returns 1/0 if the eTerraAlias is scada linked in PowerOn
+        # PowerOn is only queried once per distinct alias
         print(f"  🧠 Adding eTerraAliasExistsInPO column...")
-        merged['eTerraAliasExistsInPO'] = merged.apply(lambda row: get_poweron_alias_exists(row['eTerraAlias']), axis=1)
+        merged['eTerraAliasExistsInPO'] = lookup_unique_values(merged['eTerraAlias'], get_poweron_alias_exists)
         print(f"  🧠 Adding eTerraAliasLinkedToSCADA column...")
-        merged['eTerraAliasLinkedToSCADA'] = merged.apply(lambda row: get_poweron_alias_linked_to_scada(row['eTerraAlias']), axis=1)
+        merged['eTerraAliasLinkedToSCADA'] = lookup_unique_values(merged['eTerraAlias'], get_poweron_alias_linked_to_scada)
 
         print(f"  🧠 Adding ICCPAliasExists column...")
         # And do the same for ICCP Alias
-        merged['ICCPAliasExists'] = merged.apply(lambda row: get_poweron_alias_exists(row['ICCP_ALIAS']), axis=1)
+        merged['ICCPAliasExists'] = lookup_unique_values(merged['ICCP_ALIAS'], get_poweron_alias_exists)
         print(f"  🧠 Adding ICCPAliasLinkedToSCADA column...")
-        merged['ICCPAliasLinkedToSCADA'] = merged.apply(lambda row: get_poweron_alias_linked_to_scada(row['ICCP_ALIAS']), axis=1)
+        merged['ICCPAliasLinkedToSCADA'] = lookup_unique_values(merged['ICCP_ALIAS'], get_poweron_alias_linked_to_scada)
 
         # Add a column that is True if ALRM is in the eTerraKey and False if not
         print(f"  🧠 Adding ALARM column...")
-        merged['ALARM'] = merged.apply(lambda row: True if 'ALRM' in row['eTerraKey'] else False, axis=1)
+        merged['ALARM'] = merged['eTerraKey'].str.contains('ALRM', regex=False, na=False)
 
         # Add a column that is the second field of the FullPath field (delimited by ':') if this field exists, otherwise set to ''
         # Note this used to use LocationFull but we have changed to FullPath in dataload13 - new spreadsheet from Bill
         print(f"  🧠 Adding TopLocation column...")
-        merged['TopLocation'] = merged.apply(lambda row: row['FullPath'].split(':')[1] if pd.notna(row['FullPath']) and isinstance(row['FullPath'], str) else '', axis=1)
+        merged['TopLocation'] = merged['FullPath'].astype(object).str.split(':').str[1].fillna('')
 
         print(f"  🧠 Adding Alarm status columns...")
         # Derive the alarm status cols (for alarm number 0..3)
@@ -564,22 +620,24 @@ class RTUReportGenerator:
 
         print(f"  🧠 Adding Control status columns...")
         # Derive the ctrl status cols (for ctrl number 1..2)
+        # OK -> 1, Fail -> 0, anything else is left as <NA> (nullable Int8) which is written as a blank cell in the reports
+        result_codes = {'OK': 1, 'Fail': 0}
         for i in range(1,3):
-            merged[f'Ctrl{i}'] = merged.apply(lambda row: 1 if row[f'Ctrl{i}TestResult'] == 'OK' else 0 if row[f'Ctrl{i}TestResult'] == 'Fail' else '', axis=1)
-            merged[f'Ctrl{i}V'] = merged.apply(lambda row: 1 if row[f'Ctrl{i}VisualCheckResult'] == 'OK' else 0 if row[f'Ctrl{i}VisualCheckResult'] == 'Fail' else '', axis=1)
-            merged[f'Ctrl{i}C'] = merged.apply(lambda row: 1 if row[f'Ctrl{i}ControlSentResult'] == 'OK' else 0 if row[f'Ctrl{i}ControlSentResult'] == 'Fail' else '', axis=1)
+            merged[f'Ctrl{i}'] = merged[f'Ctrl{i}TestResult'].map(result_codes).astype('Int8')
+            merged[f'Ctrl{i}V'] = merged[f'Ctrl{i}VisualCheckResult'].map(result_codes).astype('Int8')
+            merged[f'Ctrl{i}C'] = merged[f'Ctrl{i}ControlSentResult'].map(result_codes).astype('Int8')
 
         print(f"  🧠 Adding HasCommissioningComments column...")
         # Set this column to 1 if either of Ctrl1Comments or Ctrl2Comments is not empty
-        merged['HasCommissioningComments'] = merged.apply(lambda row: 1 if row['Ctrl1Comments'] != '' or row['Ctrl2Comments'] != '' else 0, axis=1)
+        merged['HasCommissioningComments'] = ((merged['Ctrl1Comments'] != '') | (merged['Ctrl2Comments'] != '')).astype(int)
 
         print(f"  🧠 Adding SpecialDisplayRTU column...")
         # Set this column to 1 if the RTU is in the list of special display RTUs
-        merged['SpecialDisplayRTU'] = merged.apply(lambda row: 1 if row['RTU'] in self.special_display_rtus else 0, axis=1)
+        merged['SpecialDisplayRTU'] = merged['RTU'].isin(self.special_display_rtus).astype(int)
 
         print(f"  🧠 Adding NonCommissionedRTU column...")
         # Set this column to 1 if the RTU is not in the list of Non Commissioned RTUs
-        merged['NonCommissionedRTU'] = merged.apply(lambda row: 1 if row['RTU'] in self.non_commissioned_rtus else 0, axis=1)
+        merged['NonCommissionedRTU'] = merged['RTU'].isin(self.non_commissioned_rtus).astype(int)
 
         print(f"  🧠 Adding SyncClose column...")
         def get_sync_close_flag(row):
@@ -734,13 +792,17 @@ class RTUReportGenerator:
             print("Warning: No matching columns found for point_related_columns")
             point_related_df = self.compare_alarms.copy()
         else:
+            # Sort and group on an Arrow backed alias - the alarm compare sheet has a row per alarm so this key is the bulk of the string work
+            point_related_df = self.compare_alarms[point_related_columns].astype({'CompAlarmEterraAlias': 'string[pyarrow]'})
             # Sort by CompAlarmPOStatus so 'Matched' comes first
-            point_related_df = self.compare_alarms[point_related_columns].sort_values(
+            point_related_df = point_related_df.sort_values(
                 by=['CompAlarmEterraAlias', 'CompAlarmPOStatus'],
                 ascending=[True, False]  # False puts 'Matched' first
             )
             # Keep first row for each eTerraAlias (which will be 'Matched' if exists)
             point_related_df = point_related_df.groupby('CompAlarmEterraAlias').first().reset_index()
+            # Back to object strings for the merge - the group keys are never missing so no pd.NA reaches the merged data
+            point_related_df['CompAlarmEterraAlias'] = point_related_df['CompAlarmEterraAlias'].astype(object)
 
         print(f"  🧠 Merging with Component level information for {point_related_df.shape[0]} rows")
         #1.b) merge the point related df with the compare alarms df
@@ -778,12 +840,12 @@ class RTUReportGenerator:
             merged[f'Alarm{value}_MessageMatch'] = None
 
         # Create a lookup dictionary for faster access
+        # alarms with no CompAlarmeTerraAlarmMessage are dropped here once, rather than for every row that shares the alias
+        alarm_messages = self.compare_alarms['CompAlarmeTerraAlarmMessage']
+        alarms_with_message = self.compare_alarms[alarm_messages.notna() & (alarm_messages != '')]
         alarm_lookup = {}
-        for _, alarm_row in self.compare_alarms.iterrows():
-            eterra_alias = alarm_row['CompAlarmEterraAlias']
-            if eterra_alias not in alarm_lookup:
-                alarm_lookup[eterra_alias] = []
-            alarm_lookup[eterra_alias].append(alarm_row)
+        for alarm_row in alarms_with_message.to_dict('records'):
+            alarm_lookup.setdefault(alarm_row['CompAlarmEterraAlias'], []).append(alarm_row)
 
         # Process alarms using vectorized operations where possible
         merged['NumAlarms'] = 0
@@ -798,11 +860,8 @@ class RTUReportGenerator:
             for start in range(0, len(merged), chunk_size):
                 chunk = merged.iloc[start:start + chunk_size]
                 
-                for idx, row in chunk.iterrows():
-                    matching_alarms = alarm_lookup.get(row['eTerraAlias'], [])
-
-                    # remove any matching alarms that have no CompAlarmeTerraAlarmMessage
-                    matching_alarms = [alarm for alarm in matching_alarms if pd.notna(alarm['CompAlarmeTerraAlarmMessage']) and alarm['CompAlarmeTerraAlarmMessage'] != '']
+                for idx, eterra_alias in zip(chunk.index, chunk['eTerraAlias']):
+                    matching_alarms = alarm_lookup.get(eterra_alias, [])
 
                     num_alarms = len(matching_alarms)
                     num_alarms_matched = 0
@@ -818,7 +877,9 @@ class RTUReportGenerator:
                     merged.at[idx, 'NumAlarms'] = num_alarms
                     merged.at[idx, 'NumAlarmsMatched'] = num_alarms_matched
                     merged.at[idx, 'PercentAlarmsMatched'] = num_alarms_matched / num_alarms if num_alarms > 0 else 0
-                    progress.update(task, advance=1)
+
+                # advance once per chunk rather than once per row
+                progress.update(task, advance=len(chunk))
 
         print(f"  ✅ Added alarm compare related columns to merged data on {merged.shape[0]} rows")
         return merged
@@ -829,11 +890,11 @@ class RTUReportGenerator:
         if self.alarm_mismatch_manual_actions is not None:
 
             # rename the columns to have better names
-            self.alarm_mismatch_manual_actions.rename(columns={
+            self.alarm_mismatch_manual_actions = self.alarm_mismatch_manual_actions.rename(columns={
                 'eTerra Alias': 'eTerraAlias',
                 'Comments on missmatch': 'AlarmMismatchComment',
                 'TemplateAlias': 'AlarmMismatchTemplateAlias'
-            }, inplace=True)
+            })
 
             merged = pd.merge(
                 merged,
@@ -881,16 +942,16 @@ class RTUReportGenerator:
         
         # Handle duplicate GenericPointAddress values in controls test data
         controls_test_dict = {}
-        for _, row in self.controls_test.iterrows():
+        for row in self.controls_test.to_dict('records'):
             addr = row['GenericPointAddress']
-            controls_test_dict[addr] = row.to_dict()
+            controls_test_dict[addr] = row
         
         # Create dictionaries for manual commissioning lookups
         manual_commission_dict = {}
         visual_check_dict = {}
         control_sent_dict = {}
         
-        for _, row in self.manual_commissioning.iterrows():
+        for row in self.manual_commissioning.to_dict('records'):
             addr = row['CommissioningControlAddress']
             test = row['CommissioningTestName']
             if test == 'Action Verified':
@@ -902,73 +963,106 @@ class RTUReportGenerator:
 
         # Process all rows at once using vectorized operations where possible
         controllable_rows = merged[merged['Controllable'] == '1']
-        
+
+        # The per control results and per row counts are collected here and written to merged once each after the loop
+        control_results = {1: [], 2: []}
+        control_counts = []
+
         with Progress() as progress:
             task = progress.add_task("    Processing controls...", total=len(controllable_rows))
-            
-            for idx, row in controllable_rows.iterrows():
-                num_controls = 0
-                num_controls_matched = 0
-                num_controls_config_good = 0
-                num_controls_commission_ok = 0
-                num_controls_all_commission_ok = 0
-
-                for ctrl_num in [1, 2]:
-                    ctrl_addr = row[f'Ctrl{ctrl_num}Addr']
-                    if ctrl_addr != '':
-                        num_controls += 1
-                        num_controls_matched += 1
-
-                        # Lookup data from dictionaries
-                        habdde_compare_info = habdde_compare_dict.get(ctrl_addr, {})
-                        poweron_info = poweron_dict.get(ctrl_addr, {})
-                        controls_test_info = controls_test_dict.get(ctrl_addr, {})
-                        manual_commission_info = manual_commission_dict.get(ctrl_addr, {})
-                        visual_check_info = visual_check_dict.get(ctrl_addr, {})
-                        control_sent_info = control_sent_dict.get(ctrl_addr, {})
-
-                        if poweron_info and poweron_info.get('ConfigHealth') == 'GOOD':
-                            num_controls_config_good += 1
-
-                        # Check manual commissioning results
-                        if all(info.get('CommissioningResult') == 'OK' for info in 
-                              [visual_check_info, control_sent_info, manual_commission_info]):
-                            num_controls_all_commission_ok += 1
-
-                        if manual_commission_info.get('CommissioningResult') == 'OK':
-                            num_controls_commission_ok += 1
-
-                        # Update control columns
-                        merged.at[idx, f'Ctrl{ctrl_num}MatchStatus'] = habdde_compare_info.get('HbddeCompareStatus')
-                        merged.at[idx, f'Ctrl{ctrl_num}ConfigHealth'] = poweron_info.get('ConfigHealth')
-                        merged.at[idx, f'Ctrl{ctrl_num}AutoTestStatus'] = controls_test_info.get('AutoTestResult')
-                        merged.at[idx, f'Ctrl{ctrl_num}TestResult'] = manual_commission_info.get('CommissioningResult')
-                        merged.at[idx, f'Ctrl{ctrl_num}VisualCheckResult'] = visual_check_info.get('CommissioningResult')
-                        merged.at[idx, f'Ctrl{ctrl_num}ControlSentResult'] = control_sent_info.get('CommissioningResult')
-                        merged.at[idx, f'Ctrl{ctrl_num}TelecontrolAction'] = str(poweron_info.get('TC Action', ''))
-                        
-                        # Combine comments
-                        comments = ' '.join(filter(None, [
-                            visual_check_info.get('CommissioningComments', ''),
-                            control_sent_info.get('CommissioningComments', ''),
-                            manual_commission_info.get('CommissioningComments', '')
-                        ])).strip()
-                        merged.at[idx, f'Ctrl{ctrl_num}Comments'] = comments
-
-                # Update summary columns
-                merged.at[idx, 'NumControls'] = num_controls
-                merged.at[idx, 'NumControlsMatched'] = num_controls_matched
-                merged.at[idx, 'NumControlsConfigGood'] = num_controls_config_good
-                merged.at[idx, 'NumControlsCommissionOk'] = num_controls_commission_ok
-                merged.at[idx, 'NumControlsAllCommissionOk'] = num_controls_all_commission_ok
-                merged.at[idx, 'NumControlsNotCommissionOk'] = num_controls - num_controls_commission_ok
-                merged.at[idx, 'NumControlsNotAllCommissionOk'] = num_controls - num_controls_all_commission_ok
-                merged.at[idx, 'PercentControlsMatched'] = num_controls_matched / num_controls if num_controls > 0 else 0
-                merged.at[idx, 'PercentControlsConfigGood'] = num_controls_config_good / num_controls if num_controls > 0 else 0
-                merged.at[idx, 'PercentControlsCommissionOk'] = num_controls_commission_ok / num_controls if num_controls > 0 else 0
-                merged.at[idx, 'PercentControlsAllCommissionOk'] = num_controls_all_commission_ok / num_controls if num_controls > 0 else 0
-                
-                progress.update(task, advance=1)
+
+            # Process in chunks so the progress bar is only updated once per chunk
+            chunk_size = 1000
+            for start in range(0, len(controllable_rows), chunk_size):
+                chunk = controllable_rows.iloc[start:start + chunk_size]
+
+                for idx, ctrl_addrs in zip(chunk.index, chunk[['Ctrl1Addr', 'Ctrl2Addr']].itertuples(index=False, name=None)):
+                    num_controls = 0
+                    num_controls_matched = 0
+                    num_controls_config_good = 0
+                    num_controls_commission_ok = 0
+                    num_controls_all_commission_ok = 0
+
+                    for ctrl_num, ctrl_addr in zip([1, 2], ctrl_addrs):
+                        if ctrl_addr != '':
+                            num_controls += 1
+                            num_controls_matched += 1
+
+                            # Lookup data from dictionaries
+                            habdde_compare_info = habdde_compare_dict.get(ctrl_addr, {})
+                            poweron_info = poweron_dict.get(ctrl_addr, {})
+                            controls_test_info = controls_test_dict.get(ctrl_addr, {})
+                            manual_commission_info = manual_commission_dict.get(ctrl_addr, {})
+                            visual_check_info = visual_check_dict.get(ctrl_addr, {})
+                            control_sent_info = control_sent_dict.get(ctrl_addr, {})
+
+                            if poweron_info and poweron_info.get('ConfigHealth') == 'GOOD':
+                                num_controls_config_good += 1
+
+                            # Check manual commissioning results
+                            if all(info.get('CommissioningResult') == 'OK' for info in 
+                                  [visual_check_info, control_sent_info, manual_commission_info]):
+                                num_controls_all_commission_ok += 1
+
+                            if manual_commission_info.get('CommissioningResult') == 'OK':
+                                num_controls_commission_ok += 1
+
+                            # Combine comments
+                            comments = ' '.join(filter(None, [
+                                visual_check_info.get('CommissioningComments', ''),
+                                control_sent_info.get('CommissioningComments', ''),
+                                manual_commission_info.get('CommissioningComments', '')
+                            ])).strip()
+
+                            # Control columns, in the order of CONTROL_RESULT_COLUMNS
+                            control_results[ctrl_num].append((
+                                idx,
+                                habdde_compare_info.get('HbddeCompareStatus'),
+                                poweron_info.get('ConfigHealth'),
+                                controls_test_info.get('AutoTestResult'),
+                                manual_commission_info.get('CommissioningResult'),
+                                visual_check_info.get('CommissioningResult'),
+                                control_sent_info.get('CommissioningResult'),
+                                str(poweron_info.get('TC Action', '')),
+                                comments
+                            ))
+
+                    control_counts.append((num_controls, num_controls_matched, num_controls_config_good,
+                                           num_controls_commission_ok, num_controls_all_commission_ok))
+
+                # advance once per chunk rather than once per row
+                progress.update(task, advance=len(chunk))
+
+        # Update control columns
+        for ctrl_num, results in control_results.items():
+            if results:
+                result_index, *result_values = zip(*results)
+                for column, values in zip(CONTROL_RESULT_COLUMNS, result_values):
+                    merged.loc[list(result_index), f'Ctrl{ctrl_num}{column}'] = list(values)
+
+        # Update summary columns
+        counts = np.array(control_counts, dtype=int).reshape(-1, 5)
+        num_controls, num_controls_matched, num_controls_config_good, num_controls_commission_ok, num_controls_all_commission_ok = counts.T
+        has_controls = num_controls > 0
+
+        def percent_of_controls(count):
+            return np.divide(count, num_controls, out=np.zeros(len(counts)), where=has_controls)
+
+        summary_columns = {
+            'NumControls': num_controls,
+            'NumControlsMatched': num_controls_matched,
+            'NumControlsConfigGood': num_controls_config_good,
+            'NumControlsCommissionOk': num_controls_commission_ok,
+            'NumControlsAllCommissionOk': num_controls_all_commission_ok,
+            'NumControlsNotCommissionOk': num_controls - num_controls_commission_ok,
+            'NumControlsNotAllCommissionOk': num_controls - num_controls_all_commission_ok,
+            'PercentControlsMatched': percent_of_controls(num_controls_matched),
+            'PercentControlsConfigGood': percent_of_controls(num_controls_config_good),
+            'PercentControlsCommissionOk': percent_of_controls(num_controls_commission_ok),
+            'PercentControlsAllCommissionOk': percent_of_controls(num_controls_all_commission_ok)
+        }
+        for column, values in summary_columns.items():
+            merged.loc[controllable_rows.index, column] = values
 
         print(f" ✅ Added control info to merged data on {merged.shape[0]} rows")
         return merged
@@ -1093,14 +1187,14 @@ class RTUReportGenerator:
         # Convert some columns to boolean if not already
         merged_data = merged_data.reset_index(drop=True)
 
-        # Handle NaN values before converting to bool
-        merged_data['PowerOn Alias Exists'] = merged_data['PowerOn Alias Exists'].fillna(0).astype(int).astype(bool)
-        merged_data['IGNORE_RTU'] = merged_data['IGNORE_RTU'].fillna(0).astype(int).astype(bool) 
-        merged_data['IGNORE_POINT'] = merged_data['IGNORE_POINT'].fillna(0).astype(int).astype(bool)
-        merged_data['OLD_DATA'] = merged_data['OLD_DATA'].fillna(0).astype(int).astype(bool)
+        # Handle NaN values before converting to bool - one numpy cast per column (NaN -> 0 -> False)
+        for column in ['PowerOn Alias Exists', 'IGNORE_RTU', 'IGNORE_POINT', 'OLD_DATA']:
+            merged_data[column] = merged_data[column].to_numpy(dtype='float64', na_value=0).astype(bool)
 
         # HACK - remove RTU MICR4 from the data
-        merged_data = merged_data[merged_data['RTU'] != 'MICR4']
+        merged_data = merged_data[merged_data['RTU'].to_numpy() != 'MICR4']
+        if isinstance(merged_data['RTU'].dtype, pd.CategoricalDtype):
+            merged_data = merged_data.assign(RTU=merged_data['RTU'].cat.remove_unused_categories())
         print(f" :cross_mark: Removed RTU MICR4 from the data, now have {merged_data.shape[0]} rows")
 
         reports_list = [
@@ -1127,8 +1221,7 @@ class RTUReportGenerator:
             'ReportANY'
         ]
 
-        for report in reports_list:
-            merged_data = generate_defect_report_by_name(merged_data, report)
+        merged_data = generate_all_defect_reports(merged_data, reports_list)
         print(f" ✅ Added issue report flags to the merged data on {merged_data.shape[0]} rows")
         return merged_data
     
@@ -1146,31 +1239,21 @@ class RTUReportGenerator:
         print("="*80)
         print(f"Checking {mk2a_cards.shape[0]} RTU/Card pairs for MK2A cards using card tab")
 
-        def getCardType(card: int) -> str:
-            try:
-                card = int(card)
-            except:
-                return 'UNKNOWN'
-            if card >= 100 and card <= 118:
-                return 'DIGITAL'
-            if card >= 119 and card <= 135:
-                return 'INTERNAL'
-            if card >= 136 and card <= 169:
-                return 'ANALOG' # includes Taps 
-            if card > 169 and card <= 255:
-                return 'INTERNAL'
-            return 'UNKNOWN'
-        
+        # index the exports by (RTU, Card) once so each card is a dict lookup rather than a scan of the whole export
+        analog_by_rtu_card = self.eterra_analog_export.groupby(['RTU', 'Card'], observed=True).indices
+        digital_by_rtu_card = self.eterra_point_export.groupby(['RTU', 'Card'], observed=True).indices
+        # and the same for the PowerOn rows in the merged data, split into valid/invalid per card below
+        poweron_by_rtu_card = self.merged_data.groupby(['PO_RTU', 'PO_Card'], observed=True).indices
+
         def getAnalogPoints(rtu: str, card: str) -> list:
             # get the analog points for the given rtu and card
-            return self.eterra_analog_export[(self.eterra_analog_export['RTU'] == rtu) & (self.eterra_analog_export['Card'] == card)]
+            return self.eterra_analog_export.iloc[analog_by_rtu_card.get((rtu, card), [])]
         
         def getDigitalPoints(rtu: str, card: str) -> list:
             # get the digital points for the given rtu and card
-            return self.eterra_point_export[(self.eterra_point_export['RTU'] == rtu) & (self.eterra_point_export['Card'] == card)]
+            return self.eterra_point_export.iloc[digital_by_rtu_card.get((rtu, card), [])]
         
-        def geteTerraPoints(rtu: str, card: str) -> list:
-            cardType = getCardType(card)
+        def geteTerraPoints(rtu: str, card: str, cardType: str) -> list:
             if cardType == 'ANALOG':
                 return getAnalogPoints(rtu, card)
             if cardType == 'DIGITAL':
@@ -1179,114 +1262,73 @@ class RTUReportGenerator:
 
 
         # Load the eTerra card tab
-        # create a class to hold the card tab data
-        class CardTabData:
-            def __init__(self, rtu, card, protocol, card_type):
-                self.rtu = rtu
-                self.card = card
-                self.protocol = protocol
-                self.card_type = card_type
-                self.eterra_points = []
-                self.poweron_points = []
-                self.poweron_valid_points = []
-                self.poweron_invalid_points = []
-
-        result_list = []
         self.eterra_card_tab = read_habdde_card_tab_into_df(self.data_dir / self.required_files['eterra_export'])
-
-        # populate the card tab data
-        card_tab_data_list = []
-        for index, row in self.eterra_card_tab.iterrows():
-            protocol = row['protocol']
-            if protocol != 'MK2A':
-                continue
-            card_type = row['CASDU']
-            if card_type != '1':
-                continue
-            card = row['card']
-            card_type = getCardType(card)
-            if card_type == 'UNKNOWN' or card_type == 'INTERNAL':
-                continue
-
-            rtu = row['rtu']
-            card_tab_data = CardTabData(rtu, card, protocol, card_type)
-            eTerraPoints = geteTerraPoints(rtu, card)
-            for _, point in eTerraPoints.iterrows():
-                card_tab_data.eterra_points.append(point)
-            valid_rows_for_card = self.merged_data[(self.merged_data['PO_RTU'] == (rtu + '_RTU')) & (self.merged_data['PO_Card'] == card) & (self.merged_data['ConfigHealth'] == 'GOOD')]
-            invalid_rows_for_card = self.merged_data[(self.merged_data['PO_RTU'] == (rtu + '_RTU')) & (self.merged_data['PO_Card'] == card) & (self.merged_data['ConfigHealth'] != 'GOOD')]
-            for index, row in valid_rows_for_card.iterrows():
-                card_tab_data.poweron_points.append(row)
-                card_tab_data.poweron_valid_points.append(row)
-            for index, row in invalid_rows_for_card.iterrows():
-                card_tab_data.poweron_points.append(row)
-                card_tab_data.poweron_invalid_points.append(row)
-
-            card_tab_data_list.append(card_tab_data)
-
-        # now go through each card in the card_tab_list and print out the data in this format to csvfile mk2a_full_card_report.csv:
+        # build the PowerOn RTU name used to look up the merged data once for the whole card tab
+        self.eterra_card_tab['PO_RTU'] = self.eterra_card_tab['rtu'] + '_RTU'
+
+        # Label every card with its type in one go using the card number ranges
+        self.eterra_card_tab['card_type'] = classify_card_types(self.eterra_card_tab['card'])
+
+        # only the MK2A DIGITAL and ANALOG cards are reported
+        mk2a_card_rows = (self.eterra_card_tab['protocol'] == 'MK2A') & (self.eterra_card_tab['CASDU'] == '1')
+        report_cards = self.eterra_card_tab[mk2a_card_rows & self.eterra_card_tab['card_type'].isin(['ANALOG', 'DIGITAL'])]
+
+        # populate the card tab data - only the point counts are reported so we keep one tuple of counts per card
+        card_tab_records = []
+        for row in report_cards.itertuples(index=False):
+            rtu = row.rtu
+            card = row.card
+            num_eterra_points = len(geteTerraPoints(rtu, card, row.card_type))
+            poweron_rows_for_card = self.merged_data.iloc[poweron_by_rtu_card.get((row.PO_RTU, card), [])]
+            num_poweron_points = len(poweron_rows_for_card)
+            num_poweron_valid_points = int((poweron_rows_for_card['ConfigHealth'] == 'GOOD').sum())
+            card_tab_records.append((rtu, card, row.protocol, row.card_type, num_eterra_points, num_poweron_points, num_poweron_valid_points, num_poweron_points - num_poweron_valid_points))
+
+        # now write the card tab data out to csvfile mk2a_full_card_report.csv in this format (comma-space separated):
         # RTU, Card, Protocol, Card Type, eTerra Points, PowerOn Points, PowerOn Valid Points, PowerOn Invalid Points
         with open(self.output_dir / 'mk2a_full_card_report.csv', 'w') as f:
             print("RTU, Card, Protocol, Card Type, eTerra Points, PowerOn Points, PowerOn Valid Points, PowerOn Invalid Points", file=f)
-            for card_tab_data in card_tab_data_list:
-                print(f"{card_tab_data.rtu}, {card_tab_data.card}, {card_tab_data.protocol}, {card_tab_data.card_type}, {len(card_tab_data.eterra_points)}, {len(card_tab_data.poweron_points)}, {len(card_tab_data.poweron_valid_points)}, {len(card_tab_data.poweron_invalid_points)}", file=f)
+            f.writelines(', '.join(map(str, record)) + '\n' for record in card_tab_records)
 
         print("="*80)
         print("")
-        print(f"Found {len(card_tab_data_list)} Mk2a RTU/Card pairs (DIGITAL or ANALOG). See {self.output_dir / 'mk2a_full_card_report.csv'} for details.")
+        print(f"Found {len(card_tab_records)} Mk2a RTU/Card pairs (DIGITAL or ANALOG). See {self.output_dir / 'mk2a_full_card_report.csv'} for details.")
 
 
         # go through each card in the eTerra card tab, and check if a corresponding record exists in the merged_data dataframe, PO section, that is a good config health
-        for index, row in self.eterra_card_tab.iterrows():
-            rtu = row['rtu']
-            # if rtu != 'CURR':
-            #     continue
-            protocol = row['protocol']
-            if protocol != 'MK2A':
-                continue
-            card_type = row['CASDU']
-            if card_type != '1':
-                continue
-            card = row['card']
-            if card in ['250', '251', '252', '253', '254', '119', '']:
-                continue
-            valid_rows_for_card = self.merged_data[(self.merged_data['PO_RTU'] == (rtu + '_RTU')) & (self.merged_data['PO_Card'] == card) & (self.merged_data['ConfigHealth'] == 'GOOD')]
-            if valid_rows_for_card.shape[0] == 0:
-                #print(f"RTU/Card pair {rtu}/{card} has no matching record in PowerOn with a good config health")
-                result_list.append(f"{rtu},{card}")
+        # this is done as a single left-anti join of the card tab against the good PowerOn RTU/Card pairs
+        cards = self.eterra_card_tab[mk2a_card_rows & ~self.eterra_card_tab['card'].isin(MK2A_SKIP_CARDS)]
+        cards = cards.rename(columns={'card': 'PO_Card'})
+        good = self.merged_data.loc[self.merged_data['ConfigHealth'] == 'GOOD', ['PO_RTU', 'PO_Card']].drop_duplicates()
+        missing = cards.merge(good, on=['PO_RTU', 'PO_Card'], how='left', indicator=True).query("_merge == 'left_only'")
         print("="*80)
         print("")
 
-        # output the result list to a csv file, with header RTU, Card
-        with open(self.output_dir / 'mk2a_missing_card_report.csv', 'w') as f:
-            f.write('RTU,Card\n')
-            for result in result_list:
-                f.write(f"{result}\n")
-        print(f"Found {len(result_list)} RTU/Card pairs with no matching record in PowerOn with a good config health. See {self.output_dir / 'mk2a_missing_card_report.csv'} for details.")
+        # output the missing cards to a csv file, with header RTU, Card
+        missing[['rtu', 'PO_Card']].rename(columns={'rtu': 'RTU', 'PO_Card': 'Card'}).to_csv(self.output_dir / 'mk2a_missing_card_report.csv', index=False)
+        print(f"Found {missing.shape[0]} RTU/Card pairs with no matching record in PowerOn with a good config health. See {self.output_dir / 'mk2a_missing_card_report.csv'} for details.")
 
         
     def generate_statistics(self, merged_data: pd.DataFrame):
         """Generate statistics for the merged data."""
         print("Generating statistics for the merged data...")
-        # split the data by type of points in the merged data
-        SD_points = merged_data[merged_data['GenericType'] == 'SD']
-        DD_points = merged_data[merged_data['GenericType'] == 'DD']
-        A_points = merged_data[merged_data['GenericType'] == 'A']
-        DUMMY_points = merged_data[merged_data['RTUId'] == '(€€€€€€€€:)']
+        # count the points of each type in the merged data in a single pass
+        type_counts = merged_data['GenericType'].value_counts()
 
         # The number of controls is the summation of the nnumber of controls in each row
-        Control_count = merged_data[merged_data['DeviceType'] != 'RTU']['NumControls'].sum()
-        Simple_commissioned_count = merged_data[merged_data['DeviceType'] != 'RTU']['NumControlsCommissionOk'].sum()
-        All_commissioned_count = merged_data[merged_data['DeviceType'] != 'RTU']['NumControlsAllCommissionOk'].sum()
+        control_totals = merged_data.loc[merged_data['DeviceType'] != 'RTU', ['NumControls', 'NumControlsCommissionOk', 'NumControlsAllCommissionOk']].sum(numeric_only=True)
+        Control_count = control_totals.get('NumControls', 0)
+        Simple_commissioned_count = control_totals.get('NumControlsCommissionOk', 0)
+        All_commissioned_count = control_totals.get('NumControlsAllCommissionOk', 0)
         print(f"Total number of controls: {Control_count}")
         print(f"Total number of simple commissioned controls: {Simple_commissioned_count} ({(Simple_commissioned_count / Control_count * 100) if Control_count > 0 else 0.0:.1f}%)")
         print(f"Total number of all commissioned controls: {All_commissioned_count} ({(All_commissioned_count / Control_count * 100) if Control_count > 0 else 0.0:.1f}%)")
 
         num_points = merged_data.shape[0]
-        num_SD_points = SD_points.shape[0]
-        num_DD_points = DD_points.shape[0]
-        num_A_points = A_points.shape[0]
-        num_DUMMY_points = DUMMY_points.shape[0]
+        num_SD_points = type_counts.get('SD', 0)
+        num_DD_points = type_counts.get('DD', 0)
+        num_A_points = type_counts.get('A', 0)
+        num_DUMMY_points = int((merged_data['RTUId'] == '(€€€€€€€€:)').sum())
 
         # # Add control stats to each row
         # merged_data = merged_data.apply(add_control_stats_to_each_row, axis=1)
@@ -1307,19 +1349,20 @@ class RTUReportGenerator:
         
         # We will create a report for each RTU in the filtered data
         reports = []
+        rtu_index = build_rtu_index(self.merged_data)
         for rtu in rtus:
-            rtu_data = filter_data_by_rtu(self.merged_data, rtu)
+            rtu_data = filter_data_by_rtu(self.merged_data, rtu, rtu_index)
             # Create report sections
             points_section = create_points_section(rtu_data)
 
-            # Combine sections
-            report_content = pd.concat([points_section], ignore_index=True)
+            # Combine sections - there is only the points section for now so use it directly rather than concat a single frame
+            report_content = points_section
             report = {'RTU': rtu, 'Content': report_content}
             reports.append(report)
         
         # Save report
         output_path = self.output_dir / f"rtu_report_{rtu_name or substation or 'all'}.xlsx"
-        save_reports(reports, output_path)
+        save_reports_fast(reports, output_path)
         print(f"Report generated successfully: {output_path}")
 
 
@@ -1392,13 +1435,32 @@ class RTUReportGenerator:
         """Generate all reports."""
         # try to generate each report in the report_definitions dataframe
         print(f"  🧠 Generating all defined reports...")
-        for report_name, report_columns in self.report_definitions.items():
-            report_definition = {
-                'name': report_name,
-                'worksheet_name': report_name,
-                'columns': report_columns.to_dict('records')
-            }
-            generate_report_in_excel(self.merged_data, report_definition)
+
+        def report_jobs():
+            # build each report's job only when it is about to be submitted
+            for report_name, report_columns in self.report_definitions.items():
+                report_definition = {
+                    'name': report_name,
+                    'worksheet_name': report_name,
+                    'columns': report_columns.to_dict('records')
+                }
+                # only send the columns the report uses to the worker, to keep the pickled data small
+                report_df_cols = [col['dfCol'] for col in report_definition['columns'] if col['dfCol'] in self.merged_data.columns]
+                yield (self.merged_data[list(dict.fromkeys(report_df_cols))], report_definition, Path(self.output_dir))
+
+        # the reports are independent so render them in parallel, one workbook per worker
+        # no more jobs are submitted than there are workers, so only that many report slices are held at once
+        max_workers = min(MAX_REPORT_WORKERS, os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            running = set()
+            for job in report_jobs():
+                if len(running) >= max_workers:
+                    done, running = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                running.add(executor.submit(render_report_definition, job))
+            for future in running:
+                future.result()
 
     
     def debug_print_dataframes(self):
@@ -1439,12 +1501,18 @@ class RTUReportGenerator:
             print(f"Error: {str(e)}")
             sys.exit(1)
 
+def render_report_definition(job):
+    """Render a single report definition to Excel (runs in a worker process)."""
+    df, report_definition, output_path = job
+    generate_report_in_excel(df, report_definition, output_path)
+
 def get_dynamic_report_names(config_dir):
     report_definitions_file = config_dir / 'ReportDefinitions.xlsx'
-    report_definitions = pd.read_excel(report_definitions_file, sheet_name=None)
-    report_names = report_definitions.keys()
+    # only the sheet names are needed so open read-only rather than parsing every sheet
+    report_definitions_wb = load_workbook(report_definitions_file, read_only=True, keep_links=False)
+    report_names = list(report_definitions_wb.sheetnames)
+    report_definitions_wb.close()
     # remove the 'Style Guide' and 'Available Columns' sheets
-    report_names = list(report_names)
     if 'Style Guide' in report_names:
         report_names.remove('Style Guide')
     if 'Available Columns' in report_names:
@@ -1454,6 +1522,10 @@ def get_dynamic_report_names(config_dir):
 def main():
     import argparse
 
+    # Copy-on-Write lets renamed/projected frames share data until one is modified (always on from pandas 3)
+    if int(pd.__version__.split('.')[0]) < 3:
+        pd.set_option('mode.copy_on_write', True)
+
     # Setup the statically defined report names first
     valid_report_names = [
         'defect_report',
@@ -3,22 +3,31 @@
 # we need to count how many are in the old one, check theres none in the new onw and ask teh user to confrim before making the update
 
 import pandas as pd
-from openpyxl import load_workbook
+from openpyxl import load_workbook, LXML
 from openpyxl.styles import PatternFill
+from openpyxl.styles.proxy import StyleProxy
 import os
+import argparse
 from rich.progress import Progress
-import copy
 default_sheet_name = 'Sheet1'
 
 ColumnsToCopy = ['Review Status', 'Comments', 'Assigned To', 'Manual Status','Manual Status Desc','Manual Status Date', 'Control Fix Status','Control Fix Type']
 # ColumnsToCopy = ['Review Status', 'Comments', 'Assigned To']
 
+def get_header_indices(header_row):
+    # map each column name to its index - the first one wins, like header_row.index()
+    header_indices = {}
+    for i, name in enumerate(header_row):
+        header_indices.setdefault(name, i)
+    return header_indices
+
+
 def debug_a_row_in_wb(wb, ColumnName, MatchValue, sheet_name=""):
     if sheet_name == "":
         sheet_name = default_sheet_name
     ws = wb[sheet_name]
     header_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True))
-    column_index = header_row.index(ColumnName)  # Remove trailing comma
+    column_index = get_header_indices(header_row)[ColumnName]
     
     for row in ws.iter_rows(min_row=2, values_only=False):
         cell_value = row[column_index].value if row[column_index] else None
@@ -41,44 +50,19 @@ def debug_a_row_in_wb(wb, ColumnName, MatchValue, sheet_name=""):
             break
 
 
-def read_report_df_and_wb(filename, sheet_name=default_sheet_name):
-    # we want to read the values and fill colors for the following fields:
-    # GenericPointAddress
-    # eTerraAlias
-    # + ColumnsToCopy
-
-    print(f" :mag_right: Reading {filename} into a dataframe...")
-    df = pd.read_excel(filename)
-    
-    # Get list of columns that exist in the dataframe
-    available_columns = ['GenericPointAddress', 'eTerraAlias'] + [col for col in ColumnsToCopy if col in df.columns]
-    
-    # Select only available columns
-    df = df[available_columns]
-
-    print(f" :mag_right: Reading {filename} into a workbook...")
-    # Load workbook and sheet using openpyxl
-    wb = load_workbook(filename, data_only=True)
-
-    return df, wb
-
-def read_report_wb(filename):
-    return load_workbook(filename, data_only=True)
+def read_report_wb(filename, read_only=False):
+    # read only streams the rows and cannot be edited - use it for the workbook we only read from, and close it when done
+    return load_workbook(filename, read_only=read_only, data_only=True)
 
-def count_values_in_dict(wb_dict, value_to_count):
-    count = 0
-    for key in wb_dict:
-        if wb_dict[key][value_to_count][0] is not None and wb_dict[key][value_to_count][0] != '':
-            #print(f"DEBUG> Counting {value_to_count}: {wb_dict[key][value_to_count][0]}")
-            count += 1
-    return count
+# the default empty fill - a missing cell in a read only workbook has no fill, which is this fill in a normal workbook
+EMPTY_FILL = PatternFill()
 
-def count_values_in_df(df, value_to_count):
-    return df[value_to_count].count()
+def get_cell_fill(cell):
+    return cell.fill if cell.fill is not None else EMPTY_FILL
 
-
-def get_dict_of_values_and_fill_color(wb, matchmethod, sheet_name=""):
+def get_dict_of_values_and_fill_color(wb, matchmethod, sheet_name="", keys=None):
     # Create dictionaries to store the data in the worksheetfor fast lookup
+    # when keys is given, only rows with one of those keys are stored
     if sheet_name == "":
         sheet_name = default_sheet_name
     ws = wb[sheet_name]
@@ -88,80 +72,143 @@ def get_dict_of_values_and_fill_color(wb, matchmethod, sheet_name=""):
     print(f"DEBUG: Header row: {header_row}")
     print(f"DEBUG: Looking for matchmethod: {matchmethod}")
     print(f"DEBUG: Looking for columns: {ColumnsToCopy}")
+    header_indices = get_header_indices(header_row)
     
     try:
-        matchmethod_index = header_row.index(matchmethod)
+        matchmethod_index = header_indices[matchmethod]
         print(f"DEBUG: Found matchmethod at index {matchmethod_index}")
-    except ValueError as e:
+    except KeyError as e:
         print(f"ERROR: Could not find {matchmethod} in header row")
         raise
         
     try:
-        column_indices = {col: header_row.index(col) for col in ColumnsToCopy}
+        column_indices = {col: header_indices[col] for col in ColumnsToCopy}
         print(f"DEBUG: Column indices: {column_indices}")
-    except ValueError as e:
+    except KeyError as e:
         print("ERROR: Could not find one or more columns:")
         for col in ColumnsToCopy:
             if col not in header_row:
                 print(f"- Missing column: {col}")
         raise
 
-    for row in ws.iter_rows(min_row=2, values_only=False):
+    # only read as far as the last column we need - this also pads short rows in a read only workbook
+    max_col = max(matchmethod_index, *column_indices.values()) + 1
+    # the columns to copy and their indices, worked out once rather than for every row
+    copy_columns = [(col, column_indices[col]) for col in ColumnsToCopy]
+    for row in ws.iter_rows(min_row=2, max_col=max_col, values_only=False):
         key = row[matchmethod_index].value
-        if any(row[column_indices[col]].value for col in ColumnsToCopy):
-            data[key] = {col: (row[column_indices[col]].value, row[column_indices[col]].fill) for col in ColumnsToCopy}
+        if keys is not None and key not in keys:
+            continue
+        if any(row[col_idx].value for _, col_idx in copy_columns):
+            data[key] = {col: (row[col_idx].value, get_cell_fill(row[col_idx])) for col, col_idx in copy_columns}
     
     return data
 
 
-def copy_values_and_fill_color(old_wb, new_wb, matchmethod, old_sheet_name="", new_sheet_name=""):
-    if old_sheet_name == "":
-        old_sheet_name = default_sheet_name
+def get_row_index(ws, matchmethod):
+    # Index the rows of the worksheet by key - only the key column is read, and a key can be on more than one row
+    header = get_header_indices(next(ws.iter_rows(min_row=1, max_row=1, values_only=True)))
+    key_column = header[matchmethod] + 1
+    row_idx = {}
+    for row_number, (key,) in enumerate(ws.iter_rows(min_row=2, min_col=key_column, max_col=key_column, values_only=True), start=2):
+        row_idx.setdefault(key, []).append(row_number)
+    return row_idx
+
+
+def copy_values_and_fill_color(old_data, new_wb, matchmethod, new_sheet_name="", new_row_idx=None):
+    # old_data is the lookup dictionary from get_dict_of_values_and_fill_color for the old worksheet
+    # new_row_idx is the get_row_index of the new worksheet, built here if it is not passed in
     if new_sheet_name == "":
         new_sheet_name = default_sheet_name
 
-    old_ws = old_wb[old_sheet_name]
     new_ws = new_wb[new_sheet_name]
 
-    # Create dictionaries to store the old data for fast lookup
-    old_data = {}
-    old_header_row = next(old_ws.iter_rows(min_row=1, max_row=1, values_only=True))
-    matchmethod_index_old = old_header_row.index(matchmethod)
-    column_indices = {col: old_header_row.index(col) for col in ColumnsToCopy}
+    # Get new worksheet structure
+    new_header = get_header_indices(next(new_ws.iter_rows(min_row=1, max_row=1, values_only=True)))
+    new_column_indices = {col: new_header[col] for col in ColumnsToCopy}
 
-    # Build lookup dictionary from old worksheet - only store non-empty cells
-    print("Building lookup dictionary from old worksheet...")
-    for row in old_ws.iter_rows(min_row=2, values_only=False):
-        key = row[matchmethod_index_old].value
-        if any(row[column_indices[col]].value for col in ColumnsToCopy):
-            old_data[key] = {col: (row[column_indices[col]].value, row[column_indices[col]].fill) for col in ColumnsToCopy}
+    if new_row_idx is None:
+        new_row_idx = get_row_index(new_ws, matchmethod)
 
-    # Get new worksheet structure
-    new_header_row = next(new_ws.iter_rows(min_row=1, max_row=1, values_only=True))
-    matchmethod_index_new = new_header_row.index(matchmethod)
-    new_column_indices = {col: new_header_row.index(col) + 1 for col in ColumnsToCopy}
+    # the columns to copy and where they are in the new worksheet - worked out once rather than for every row
+    copy_plan = [(col_name, new_column_indices[col_name] + 1) for col_name in ColumnsToCopy]
+    changed_count = 0
 
-    # Process new worksheet using the lookup dictionary
+    # Go through the old data and update the matching rows in the new worksheet
     print("Copying data to new worksheet...")
     with Progress() as progress:
         task = progress.add_task("Processing rows...", total=len(old_data))
         
-        for row in new_ws.iter_rows(min_row=2, values_only=False):
-            key = row[matchmethod_index_new].value
-            if key in old_data:
-                for col_name in ColumnsToCopy:
-                    old_value, old_fill = old_data[key][col_name]
-                    new_cell = row[new_column_indices[col_name] - 1]
+        for entry_count, (key, old_entry) in enumerate(old_data.items(), start=1):
+            # advance once per 1000 entries rather than once per entry
+            if entry_count % 1000 == 0:
+                progress.update(task, advance=1000)
+            for row_number in new_row_idx.get(key, []):
+                for col_name, new_column in copy_plan:
+                    old_value, old_fill = old_entry[col_name]
+                    new_cell = new_ws.cell(row=row_number, column=new_column)
                     
                     if new_cell.value != old_value:
                         new_cell.value = old_value
+                        changed_count += 1
                         if old_fill is not None:
-                            new_cell.fill = copy.copy(old_fill)
-                progress.advance(task)
+                            # fills from a read only workbook are plain style objects that can be shared between cells,
+                            # a normal workbook gives a StyleProxy which has to be unwrapped before it can be assigned
+                            new_fill = old_fill.copy() if isinstance(old_fill, StyleProxy) else old_fill
+                            # most cells already have the same fill (usually none), so only restyle the ones that differ
+                            if new_cell.fill != new_fill:
+                                new_cell.fill = new_fill
+        progress.update(task, completed=len(old_data))
+
+    return changed_count
+
+
+def read_copy_columns_df(filename, matchmethod, sheet_name=default_sheet_name):
+    # the dataframe version of get_dict_of_values_and_fill_color - only rows with something in them, the last row wins for a repeated key
+    # only blank cells are missing, as in the openpyxl values - by default read_excel also blanks text such as "NA" or "N/A"
+    df = pd.read_excel(filename, sheet_name=sheet_name, engine='openpyxl', usecols=[matchmethod] + ColumnsToCopy,
+                       keep_default_na=False, na_values=[''])
+    has_values = df[ColumnsToCopy].fillna('').astype(bool).any(axis=1)
+    return df[has_values].drop_duplicates(subset=matchmethod, keep='last').set_index(matchmethod)[ColumnsToCopy]
+
+
+def count_values_in_df_columns(df):
+    # count the cells with a value in each copy column - anything other than empty or blank counts, 0 included
+    values = df[ColumnsToCopy]
+    counts = (values.notna() & (values != '')).sum()
+    return {col: int(count) for col, count in counts.items()}
+
+
+def copy_values_only(old_df, new_file, matchmethod, new_sheet_name=""):
+    # Copy just the values with pandas and rewrite the new sheet - the fills and formatting of that sheet are not kept
+    if new_sheet_name == "":
+        new_sheet_name = default_sheet_name
+
+    # the whole sheet is written back, so only blank cells may be read as missing - by default read_excel
+    # would also blank text such as "NA", "N/A" or "null" in every column, the keys included
+    new_df = pd.read_excel(new_file, sheet_name=new_sheet_name, engine='openpyxl', keep_default_na=False, na_values=[''])
+    # line up the old row for each new key once and reuse it for every column - old_df has one row per key
+    old_values = old_df.reindex(new_df[matchmethod])
+    has_old_values = new_df[matchmethod].isin(old_df.index).to_numpy()
+
+    # only the cells whose value actually changes are replaced
+    changed_count = 0
+    for col in ColumnsToCopy:
+        new_col = new_df[col].to_numpy(dtype=object, copy=True)
+        old_col = old_values[col].to_numpy(dtype=object)
+        same = (new_col == old_col) | (pd.isna(new_col) & pd.isna(old_col))
+        changed = has_old_values & ~same
+        new_col[changed] = old_col[changed]
+        new_df[col] = new_col
+        changed_count += changed.sum()
+    print(f"Copying {changed_count} changed values to {has_old_values.sum()} rows in the new worksheet...")
+
+    # replace only the new sheet, any other sheets in the file are kept
+    with pd.ExcelWriter(new_file, engine='openpyxl', mode='a', if_sheet_exists='replace') as writer:
+        new_df.to_excel(writer, sheet_name=new_sheet_name, index=False)
 
 
 def get_params():
-    import argparse
     # we need the filenames to be explicity passed in as arguments
 
     parser = argparse.ArgumentParser(description=f"Copy columns {ColumnsToCopy} from defect report, values and fill color")
@@ -170,13 +217,14 @@ def get_params():
     parser.add_argument("--oldsheetname", required=False, help="Sheet name to use in the old file")
     parser.add_argument("--newsheetname", required=False, help="Sheet name to use in the new file")
     parser.add_argument("--matchmethod", choices=["eTerraAlias", "GenericPointAddress"], default="GenericPointAddress", help="Method to match the rows between the two files")
+    parser.add_argument("--values-only", action="store_true", help="Only copy the values (not the fill colors) - faster, but the new sheet is rewritten without its formatting")
     args = parser.parse_args()
 
     # Check if the files exist
-    if not os.path.exists(args.oldfile):
+    if not os.path.isfile(args.oldfile):
         print(f"Error: The file {args.oldfile} does not exist.")
         exit(1)
-    if not os.path.exists(args.newfile):
+    if not os.path.isfile(args.newfile):
         print(f"Error: The file {args.newfile} does not exist.")
         exit(1)
 
@@ -187,40 +235,79 @@ def get_params():
 
     print("")
     print(f"Using matchmethod: {args.matchmethod} to copy columns {ColumnsToCopy} from {args.oldfile} sheet {args.oldsheetname} to {args.newfile} sheet {args.newsheetname}\n")
-    return args.oldfile, args.newfile, args.matchmethod, args.oldsheetname, args.newsheetname
+    return args.oldfile, args.newfile, args.matchmethod, args.oldsheetname, args.newsheetname, args.values_only
+
+def confirm_update(old_df, new_df):
+    # print the counts for each file and ask the user to confirm before making the update
+    old_counts = count_values_in_df_columns(old_df)
+    new_counts = count_values_in_df_columns(new_df)
+    for col in ColumnsToCopy:
+        print(f"Old {col} count: {old_counts[col]}")
+        print(f"New {col} count: {new_counts[col]}")
+
+    user_confirm = input("Are you sure you want to make the update? (y/n): ")
+    if user_confirm != "y":
+        print("Update cancelled.")
+        return False
+    return True
+
+def main_values_only(old_file, new_file, matchmethod, old_sheet_name, new_sheet_name):
+    old_df = read_copy_columns_df(old_file, matchmethod, old_sheet_name)
+    new_df = read_copy_columns_df(new_file, matchmethod, new_sheet_name)
+
+    print(f"Opened old file {old_file} and new file {new_file}...")
+
+    if not confirm_update(old_df, new_df):
+        return
+
+    copy_values_only(old_df, new_file, matchmethod, new_sheet_name)
+
+    print(f"Updated {new_file} with the values from {old_file}.")
 
 def main():
-    old_file, new_file, matchmethod, old_sheet_name, new_sheet_name = get_params()
+    old_file, new_file, matchmethod, old_sheet_name, new_sheet_name, values_only = get_params()
+
+    if values_only:
+        main_values_only(old_file, new_file, matchmethod, old_sheet_name, new_sheet_name)
+        return
 
     # we need to count how many are in the old one, check theres none in the new onw and ask the user to confirm before making the update
-    old_wb = read_report_wb(old_file)
-    # debug_a_row_in_wb(old_wb, "eTerraAlias", "TONG1/011_CB/661_13/AMPS")
-    # debug_a_row_in_wb(old_wb, "eTerraAlias", "NOKY1/033_SC/WF_B/MW")
-    old_dict = get_dict_of_values_and_fill_color(old_wb, matchmethod, old_sheet_name)
-    new_wb = read_report_wb(new_file)
-    new_dict = get_dict_of_values_and_fill_color(new_wb, matchmethod, new_sheet_name)
+    # the counts only need the values, so pandas reads them - the fills are only read from the old workbook when copying
+    old_df = read_copy_columns_df(old_file, matchmethod, old_sheet_name)
+    new_df = read_copy_columns_df(new_file, matchmethod, new_sheet_name)
 
     print(f"Opened old file {old_file} and new file {new_file}...")
 
-    for col in ColumnsToCopy:
-        old_count = count_values_in_dict(old_dict, col)
-        new_count = count_values_in_dict(new_dict, col)
-        print(f"Old {col} count: {old_count}")
-        print(f"New {col} count: {new_count}")
-
-    # Ask the user to confirm before making the update
-    user_confirm = input("Are you sure you want to make the update? (y/n): ")
-    if user_confirm != "y":
-        print("Update cancelled.")
+    if not confirm_update(old_df, new_df):
         return
 
+    # index the new rows by key, read by openpyxl so the keys compare the same way as the old ones
+    new_wb = read_report_wb(new_file)
+    new_row_idx = get_row_index(new_wb[new_sheet_name], matchmethod)
+
+    # the old workbook is only read from, so it can be streamed - it is read once and closed straight after
+    # only old rows with a key in the new sheet can ever be copied, so the rest are not stored
+    old_wb = read_report_wb(old_file, read_only=True)
+    # debug_a_row_in_wb(old_wb, "eTerraAlias", "TONG1/011_CB/661_13/AMPS")
+    # debug_a_row_in_wb(old_wb, "eTerraAlias", "NOKY1/033_SC/WF_B/MW")
+    print("Building lookup dictionary from old worksheet...")
+    old_data = get_dict_of_values_and_fill_color(old_wb, matchmethod, old_sheet_name, keys=new_row_idx)
+    old_wb.close()
+
     # Make the update for the values and fill color
-    copy_values_and_fill_color(old_wb, new_wb, matchmethod, old_sheet_name, new_sheet_name)
+    changed_count = copy_values_and_fill_color(old_data, new_wb, matchmethod, new_sheet_name, new_row_idx=new_row_idx)
+
+    # Saving rewrites the whole workbook, so skip it when nothing changed
+    if changed_count == 0:
+        print(f"No values changed, {new_file} was not saved.")
+        return
 
-    # Save the new file
+    # Save the new file - openpyxl only uses its faster streaming writer when lxml is installed
+    if not LXML:
+        print("Warning: lxml is not installed, saving a large workbook will be slow (conda install lxml)")
     new_wb.save(new_file)
 
-    print(f"Updated {new_file} with the values and fill color from {old_file}.")
+    print(f"Updated {changed_count} cells in {new_file} with the values and fill color from {old_file}.")
 
 
 if __name__ == "__main__":